@@ -0,0 +1,43 @@
+"""Indexes for the hot query paths
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:30:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep only the newest RSVP per (user, event) before enforcing uniqueness
+    op.execute(
+        "DELETE FROM rsvp WHERE id NOT IN ("
+        "SELECT MAX(id) FROM rsvp GROUP BY user_id, event_id)"
+    )
+    op.create_index("ix_rsvp_user_id_event_id", "rsvp", ["user_id", "event_id"], unique=True, if_not_exists=True)
+    op.create_index("ix_rsvp_event_id_user_id", "rsvp", ["event_id", "user_id"], if_not_exists=True)
+
+    op.create_index("ix_event_is_active_date", "event", ["is_active", "date", "id"], if_not_exists=True)
+    op.create_index("ix_event_organizer_id", "event", ["organizer_id"], if_not_exists=True)
+
+    op.create_index(
+        "ix_comment_event_id_is_approved",
+        "comment",
+        ["event_id", "is_approved", "created_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_comment_event_id_is_approved", table_name="comment")
+    op.drop_index("ix_event_organizer_id", table_name="event")
+    op.drop_index("ix_event_is_active_date", table_name="event")
+    op.drop_index("ix_rsvp_event_id_user_id", table_name="rsvp")
+    op.drop_index("ix_rsvp_user_id_event_id", table_name="rsvp")
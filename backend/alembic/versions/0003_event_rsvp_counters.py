@@ -0,0 +1,36 @@
+"""Denormalized RSVP counters on event
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 11:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("event", sa.Column("going_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("event", sa.Column("interested_count", sa.Integer(), server_default="0", nullable=False))
+
+    # Backfill from existing RSVPs (statuses are stored by enum name)
+    op.execute(
+        "UPDATE event SET "
+        "going_count = (SELECT COUNT(*) FROM rsvp "
+        "WHERE rsvp.event_id = event.id AND rsvp.status = 'GOING'), "
+        "interested_count = (SELECT COUNT(*) FROM rsvp "
+        "WHERE rsvp.event_id = event.id AND rsvp.status = 'INTERESTED')"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("event") as batch_op:
+        batch_op.drop_column("interested_count")
+        batch_op.drop_column("going_count")
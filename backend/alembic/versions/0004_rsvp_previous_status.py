@@ -0,0 +1,37 @@
+"""Previous status on RSVP for single-statement upserts
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Reuses the rsvpstatus type created with the rsvp table
+    op.add_column(
+        "rsvp",
+        sa.Column(
+            "previous_status",
+            sa.Enum("GOING", "INTERESTED", "NOT_GOING", name="rsvpstatus").with_variant(
+                postgresql.ENUM("GOING", "INTERESTED", "NOT_GOING", name="rsvpstatus", create_type=False),
+                "postgresql"
+            ),
+            nullable=True
+        )
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("rsvp") as batch_op:
+        batch_op.drop_column("previous_status")
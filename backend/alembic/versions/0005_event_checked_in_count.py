@@ -0,0 +1,30 @@
+"""Checked-in counter on event
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 13:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("event", sa.Column("checked_in_count", sa.Integer(), server_default="0", nullable=False))
+
+    op.execute(
+        "UPDATE event SET checked_in_count = (SELECT COUNT(*) FROM rsvp "
+        "WHERE rsvp.event_id = event.id AND rsvp.checked_in)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("event") as batch_op:
+        batch_op.drop_column("checked_in_count")
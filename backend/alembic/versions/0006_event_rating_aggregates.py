@@ -0,0 +1,40 @@
+"""Rating aggregates on event
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 14:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+COLUMNS = ["rating_count", "rating_sum"] + [f"rating_{star}_count" for star in range(1, 6)]
+
+
+def upgrade():
+    for name in COLUMNS:
+        op.add_column("event", sa.Column(name, sa.Integer(), server_default="0", nullable=False))
+
+    # Backfill from approved, rated comments
+    rated = "FROM comment WHERE comment.event_id = event.id AND comment.is_approved AND comment.rating IS NOT NULL"
+    assignments = [
+        f"rating_count = (SELECT COUNT(*) {rated})",
+        f"rating_sum = (SELECT COALESCE(SUM(comment.rating), 0) {rated})",
+    ] + [
+        f"rating_{star}_count = (SELECT COUNT(*) {rated} AND comment.rating = {star})"
+        for star in range(1, 6)
+    ]
+    op.execute("UPDATE event SET " + ", ".join(assignments))
+
+
+def downgrade():
+    with op.batch_alter_table("event") as batch_op:
+        for name in reversed(COLUMNS):
+            batch_op.drop_column(name)
@@ -0,0 +1,28 @@
+"""Index for the comment moderation queue
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 15:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_comment_is_approved_created_at",
+        "comment",
+        ["is_approved", "created_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_comment_is_approved_created_at", table_name="comment")
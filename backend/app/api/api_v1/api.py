@@ -1,8 +1,12 @@
 from fastapi import APIRouter
-from app.api.api_v1.endpoints import events, users, auth, comments
+from app.api.api_v1.endpoints import events, users, auth, comments, checkin, live, jobs, profiler
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(events.router, prefix="/events", tags=["events"])
-api_router.include_router(comments.router, prefix="/events", tags=["comments"])
\ No newline at end of file
+api_router.include_router(comments.router, prefix="/events", tags=["comments"])
+api_router.include_router(checkin.router, prefix="/events", tags=["checkin"])
+api_router.include_router(live.router, prefix="/live", tags=["live"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(profiler.router, prefix="/profiler", tags=["profiler"])
\ No newline at end of file
@@ -0,0 +1,171 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import case, false, true, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+from app.db.database import get_async_session
+from app.models.checkin import CheckInBatch, CheckInBatchResponse, CheckInCode, CheckInResult
+from app.models.event import Event
+from app.models.rsvp import RSVP, RSVPStatus
+from app.models.user import User
+from app.core.auth import get_current_active_user
+from app.core.checkin import create_checkin_code, verify_checkin_code
+from app.core.config import settings
+from app.core.live import event_channels, live_hub
+from app.api.api_v1.endpoints.events import invalidate_event_cache
+
+router = APIRouter()
+
+async def get_managed_event(event_id: int, session: AsyncSession, current_user: User) -> Event:
+    event = await session.get(Event, event_id)
+    if not event or not event.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    if event.organizer_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to check in attendees for this event"
+        )
+    return event
+
+def scan_time(scanned_at: Optional[datetime], now: datetime) -> datetime:
+    """Naive UTC scan time; scanner clocks are not trusted to be in the future."""
+    if scanned_at is None:
+        return now
+    if scanned_at.tzinfo is not None:
+        scanned_at = scanned_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return min(scanned_at, now)
+
+@router.get("/{event_id}/checkin-code", response_model=CheckInCode)
+async def get_checkin_code(
+    event_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    # Inactive (deleted) events issue no tickets
+    statement = select(RSVP.id).join(Event, RSVP.event_id == Event.id).where(
+        RSVP.user_id == current_user.id,
+        RSVP.event_id == event_id,
+        RSVP.status == RSVPStatus.GOING,
+        Event.is_active == true()
+    )
+    rsvp_id = (await session.exec(statement)).first()
+    if rsvp_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No GOING RSVP for this event"
+        )
+    return CheckInCode(event_id=event_id, rsvp_id=rsvp_id, code=create_checkin_code(rsvp_id, event_id))
+
+@router.post("/{event_id}/checkin", response_model=CheckInBatchResponse)
+async def bulk_checkin(
+    event_id: int,
+    batch: CheckInBatch,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    if len(batch.scans) > settings.CHECKIN_BATCH_MAX:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.CHECKIN_BATCH_MAX} scans per batch"
+        )
+    event = await get_managed_event(event_id, session, current_user)
+
+    # Signatures are checked in memory; only genuine codes for this event reach the database
+    now = datetime.utcnow()
+    results: list = [None] * len(batch.scans)
+    pending: Dict[int, Tuple[int, datetime]] = {}
+    for index, scan in enumerate(batch.scans):
+        decoded = verify_checkin_code(scan.code)
+        if decoded is None:
+            results[index] = CheckInResult(code=scan.code, result="invalid")
+        elif decoded[0] != event_id:
+            results[index] = CheckInResult(code=scan.code, result="wrong_event", rsvp_id=decoded[1])
+        elif decoded[1] in pending:
+            results[index] = CheckInResult(code=scan.code, result="duplicate", rsvp_id=decoded[1])
+        else:
+            pending[decoded[1]] = (index, scan_time(scan.scanned_at, now))
+
+    applied = 0
+    checked_in_count = event.checked_in_count
+    if pending:
+        # One conditional UPDATE checks in every eligible RSVP, keeping each scan's own time;
+        # the checked_in guard makes a ticket scanned at two doors count once
+        rsvp = RSVP.__table__
+        checked_in_at = case(
+            {rsvp_id: scanned_at for rsvp_id, (_, scanned_at) in pending.items()},
+            value=rsvp.c.id
+        )
+        statement = (
+            update(rsvp)
+            .where(
+                rsvp.c.id.in_(pending),
+                rsvp.c.event_id == event_id,
+                rsvp.c.status == RSVPStatus.GOING,
+                rsvp.c.checked_in == false()
+            )
+            .values(checked_in=True, checked_in_at=checked_in_at)
+            .returning(rsvp.c.id, rsvp.c.user_id, rsvp.c.checked_in_at)
+        )
+        for rsvp_id, user_id, at in (await session.exec(statement)).all():
+            index, _ = pending.pop(rsvp_id)
+            results[index] = CheckInResult(
+                code=batch.scans[index].code, result="checked_in",
+                rsvp_id=rsvp_id, user_id=user_id, checked_in_at=at
+            )
+            applied += 1
+
+        # Explain the scans that were not applied
+        if pending:
+            statement = select(RSVP.id, RSVP.user_id, RSVP.status, RSVP.checked_in, RSVP.checked_in_at).where(
+                RSVP.id.in_(pending), RSVP.event_id == event_id
+            )
+            for rsvp_id, user_id, rsvp_status, checked_in, at in (await session.exec(statement)).all():
+                index, _ = pending.pop(rsvp_id)
+                results[index] = CheckInResult(
+                    code=batch.scans[index].code,
+                    result="already_checked_in" if checked_in else "not_going",
+                    rsvp_id=rsvp_id, user_id=user_id, checked_in_at=at
+                )
+            for rsvp_id, (index, _) in pending.items():
+                results[index] = CheckInResult(code=batch.scans[index].code, result="not_found", rsvp_id=rsvp_id)
+
+        if applied:
+            counter = (
+                update(Event)
+                .where(Event.id == event_id)
+                .values(checked_in_count=Event.checked_in_count + applied)
+                .returning(Event.checked_in_count)
+                .execution_options(synchronize_session=False)
+            )
+            checked_in_count = (await session.exec(counter)).scalar_one()
+
+    await session.commit()
+    if applied:
+        invalidate_event_cache(event_id)
+        live_hub.publish(
+            event_channels(event_id, event.organizer_id), "checkin", event_id=event_id,
+            checked_in=applied, checked_in_count=checked_in_count
+        )
+
+    return CheckInBatchResponse(
+        event_id=event_id, checked_in=applied, checked_in_count=checked_in_count, results=results
+    )
+
+@router.get("/{event_id}/checkin")
+async def get_checkin_stats(
+    event_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    # Read the counters fresh; this is polled by door staff and never cached
+    event = await get_managed_event(event_id, session, current_user)
+    return {
+        "event_id": event.id,
+        "checked_in_count": event.checked_in_count,
+        "going_count": event.going_count,
+        "max_attendees": event.max_attendees,
+    }
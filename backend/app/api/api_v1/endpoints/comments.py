@@ -1,23 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session, select
-from typing import List
-from app.db.database import get_session
-from app.models.comment import Comment, CommentCreate, CommentUpdate, CommentResponse
+from collections import Counter
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy import delete, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import datetime
+from typing import List, Optional
+from app.db.counters import add_event_ratings, adjust_event_ratings, counted_rating
+from app.db.database import get_async_session
+from app.models.comment import Comment, CommentCreate, CommentUpdate, CommentResponse, CommentModeration
 from app.models.user import User
 from app.models.event import Event
 from app.core.auth import get_current_active_user, require_admin
+from app.core.config import settings
+from app.core.live import event_channels, live_hub
+from app.core.pagination import finish_page, paginate
+from app.api.api_v1.endpoints.events import invalidate_event_cache
 
 router = APIRouter()
 
 @router.get("/{event_id}/comments", response_model=List[CommentResponse])
 async def get_event_comments(
     event_id: int,
-    session: Session = Depends(get_session),
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
     skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100)
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None
 ):
     # Check if event exists
-    event = session.get(Event, event_id)
+    event = await session.get(Event, event_id)
     if not event or not event.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -29,11 +40,15 @@ async def get_event_comments(
         select(Comment, User.full_name)
         .join(User, Comment.user_id == User.id)
         .where(Comment.event_id == event_id, Comment.is_approved == True)
-        .offset(skip)
-        .limit(limit)
+    )
+    statement = paginate(
+        statement, (Comment.created_at, Comment.id), (datetime, int), cursor, skip, limit
     )
     
-    results = session.exec(statement).all()
+    results = finish_page(
+        (await session.exec(statement)).all(), limit,
+        lambda row: (row[0].created_at, row[0].id), response
+    )
     
     comments = []
     for comment, user_name in results:
@@ -49,41 +64,49 @@ async def get_event_comments(
 async def create_comment(
     event_id: int,
     comment_data: CommentCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user)
 ):
     # Check if event exists
-    event = session.get(Event, event_id)
+    event = await session.get(Event, event_id)
     if not event or not event.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
     
-    # Create comment
+    # Create comment (the event comes from the path, not the body)
     db_comment = Comment(
-        **comment_data.dict(),
+        **comment_data.dict(exclude={"event_id"}),
         user_id=current_user.id,
         event_id=event_id
     )
     
     session.add(db_comment)
-    session.commit()
-    session.refresh(db_comment)
+    await adjust_event_ratings(session, event_id, None, counted_rating(db_comment))
+    await session.commit()
+    await session.refresh(db_comment)
+    invalidate_event_cache(event_id)
     
-    return CommentResponse(
+    comment_response = CommentResponse(
         **db_comment.dict(),
         user_name=current_user.full_name
     )
+    if db_comment.is_approved:
+        live_hub.publish(
+            event_channels(event_id, event.organizer_id), "comment", event_id=event_id,
+            comment=comment_response
+        )
+    return comment_response
 
 @router.put("/comments/{comment_id}", response_model=CommentResponse)
 async def update_comment(
     comment_id: int,
     comment_data: CommentUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user)
 ):
-    comment = session.get(Comment, comment_id)
+    comment = await session.get(Comment, comment_id)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -97,13 +120,17 @@ async def update_comment(
             detail="Not authorized to update this comment"
         )
     
+    old_rating = counted_rating(comment)
     update_data = comment_data.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(comment, field, value)
     
     session.add(comment)
-    session.commit()
-    session.refresh(comment)
+    await adjust_event_ratings(session, comment.event_id, old_rating, counted_rating(comment))
+    await session.commit()
+    await session.refresh(comment)
+    if old_rating != counted_rating(comment):
+        invalidate_event_cache(comment.event_id)
     
     return CommentResponse(
         **comment.dict(),
@@ -113,10 +140,10 @@ async def update_comment(
 @router.delete("/comments/{comment_id}")
 async def delete_comment(
     comment_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user)
 ):
-    comment = session.get(Comment, comment_id)
+    comment = await session.get(Comment, comment_id)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -130,27 +157,35 @@ async def delete_comment(
             detail="Not authorized to delete this comment"
         )
     
-    session.delete(comment)
-    session.commit()
+    await adjust_event_ratings(session, comment.event_id, counted_rating(comment), None)
+    await session.delete(comment)
+    await session.commit()
+    invalidate_event_cache(comment.event_id)
     return {"message": "Comment deleted successfully"}
 
 @router.get("/comments/pending", response_model=List[CommentResponse])
 async def get_pending_comments(
-    session: Session = Depends(get_session),
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(require_admin),
     skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100)
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None
 ):
     """Admin endpoint to view pending comments for moderation."""
     statement = (
         select(Comment, User.full_name)
         .join(User, Comment.user_id == User.id)
         .where(Comment.is_approved == False)
-        .offset(skip)
-        .limit(limit)
+    )
+    statement = paginate(
+        statement, (Comment.created_at, Comment.id), (datetime, int), cursor, skip, limit
     )
     
-    results = session.exec(statement).all()
+    results = finish_page(
+        (await session.exec(statement)).all(), limit,
+        lambda row: (row[0].created_at, row[0].id), response
+    )
     
     comments = []
     for comment, user_name in results:
@@ -165,19 +200,117 @@ async def get_pending_comments(
 @router.put("/comments/{comment_id}/approve")
 async def approve_comment(
     comment_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(require_admin)
 ):
     """Admin endpoint to approve a comment."""
-    comment = session.get(Comment, comment_id)
+    comment = await session.get(Comment, comment_id)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comment not found"
         )
     
-    comment.is_approved = True
-    session.add(comment)
-    session.commit()
+    # Conditional so concurrent approvals count the rating once
+    result = await session.exec(
+        update(Comment)
+        .where(Comment.id == comment_id, Comment.is_approved == False)
+        .values(is_approved=True)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        await adjust_event_ratings(session, comment.event_id, None, comment.rating)
+    await session.commit()
+    if result.rowcount:
+        invalidate_event_cache(comment.event_id)
+        # The bulk UPDATE left the loaded comment stale, so the response sets the new state
+        event = await session.get(Event, comment.event_id)
+        user_name = (await session.exec(select(User.full_name).where(User.id == comment.user_id))).one()
+        comment_response = CommentResponse(
+            **{**comment.dict(), "is_approved": True},
+            user_name=user_name
+        )
+        live_hub.publish(
+            event_channels(comment.event_id, event.organizer_id), "comment", event_id=comment.event_id,
+            comment=comment_response
+        )
     
     return {"message": "Comment approved successfully"}
+
+def moderation_batches(criteria: CommentModeration) -> list:
+    """WHERE clauses for each batch of pending comments selected by a moderation request."""
+    filters = [Comment.is_approved == False]
+    if criteria.event_id is not None:
+        filters.append(Comment.event_id == criteria.event_id)
+    if criteria.user_id is not None:
+        filters.append(Comment.user_id == criteria.user_id)
+    if criteria.created_after is not None:
+        filters.append(Comment.created_at >= criteria.created_after)
+    if criteria.created_before is not None:
+        filters.append(Comment.created_at < criteria.created_before)
+
+    if criteria.ids is None:
+        if len(filters) == 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide comment IDs or at least one filter"
+            )
+        return [filters]
+
+    ids = list(dict.fromkeys(criteria.ids))
+    size = settings.BULK_BATCH_SIZE
+    return [filters + [Comment.id.in_(ids[i:i + size])] for i in range(0, len(ids), size)]
+
+@router.post("/comments/moderation/approve")
+async def bulk_approve_comments(
+    criteria: CommentModeration,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(require_admin)
+):
+    """Admin endpoint to approve pending comments in bulk."""
+    approved = 0
+    changed_events = set()
+    approved_by_event = Counter()
+    for where in moderation_batches(criteria):
+        result = await session.exec(
+            update(Comment)
+            .where(*where)
+            .values(is_approved=True)
+            .returning(Comment.event_id, Comment.rating)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        changed_events |= await add_event_ratings(session, rows)
+        await session.commit()
+        approved += len(rows)
+        approved_by_event.update(event_id for event_id, _ in rows)
+
+    for event_id in changed_events:
+        invalidate_event_cache(event_id)
+    if approved_by_event:
+        organizers = dict((await session.exec(
+            select(Event.id, Event.organizer_id).where(Event.id.in_(approved_by_event))
+        )).all())
+        for event_id, count in approved_by_event.items():
+            live_hub.publish(
+                event_channels(event_id, organizers.get(event_id)), "comments_approved",
+                event_id=event_id, count=count
+            )
+    return {"approved": approved}
+
+@router.post("/comments/moderation/reject")
+async def bulk_reject_comments(
+    criteria: CommentModeration,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(require_admin)
+):
+    """Admin endpoint to reject (delete) pending comments in bulk."""
+    rejected = 0
+    for where in moderation_batches(criteria):
+        # Pending comments are not part of any rating aggregate
+        result = await session.exec(
+            delete(Comment).where(*where).execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        rejected += result.rowcount
+    return {"rejected": rejected}
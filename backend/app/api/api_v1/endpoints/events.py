@@ -1,33 +1,124 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session, select
-from typing import List, Optional
-from app.db.database import get_session
-from app.models.event import Event, EventCreate, EventUpdate
+import io
+from fastapi import APIRouter, Depends, File, HTTPException, status, Query, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import case, func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import datetime
+from typing import List, Optional, Union
+from app.db.database import async_session_maker, get_async_session
+from app.db.counters import adjust_event_counters
+from app.db.event_io import (
+    ATTENDEE_EXPORT_FIELDS, EXPORT_FIELDS, ImportReport, attendee_export_statement, csv_header,
+    export_statement, format_rows, guess_format, import_batch, read_batches
+)
+from app.db.rsvps import upsert_rsvp_statement
+from app.db.search import apply_search, index_event, remove_event
+from app.models.event import CARD_DESCRIPTION_LENGTH, Event, EventCard, EventCreate, EventFields, EventUpdate
 from app.models.user import User
-from app.models.rsvp import RSVP, RSVPCreate, RSVPUpdate, RSVPStatus
-from app.core.auth import get_current_active_user, require_organizer_or_admin
+from app.models.rsvp import RSVP, RSVPCreate, RSVPUpdate, RSVPResponse, RSVPStatus
+from app.core.auth import get_current_active_user, require_admin, require_organizer_or_admin
+from app.core.pagination import finish_page, paginate
+from app.core.live import event_channels, live_hub
+from app.core.response_cache import response_cache
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Event])
-@router.get("", response_model=List[Event])  # Handle both with and without trailing slash
+def event_columns(fields: Optional[str], view: Optional[str]) -> list:
+    """Columns to SELECT for an event list: a card view, a field list, or all columns."""
+    columns = Event.__table__.columns
+    if view == "card":
+        return [
+            columns[name] if name != "description"
+            else func.substr(Event.description, 1, CARD_DESCRIPTION_LENGTH).label("description")
+            for name in EventCard.model_fields
+        ]
+    if not fields:
+        return list(columns)
+
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in columns]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown event fields: {', '.join(unknown)}"
+        )
+    # id and date are the pagination key, so they are always returned
+    return [columns[name] for name in dict.fromkeys(["id", "date", *names])]
+
+def invalidate_event_cache(event_id: int) -> None:
+    """Drop cached reads that may include this event."""
+    response_cache.invalidate("events")
+    response_cache.invalidate(f"event:{event_id}")
+
+async def publish_event_counts(session: AsyncSession, event_id: int) -> None:
+    """Push an event's current RSVP counters to its live subscribers."""
+    if not live_hub.enabled:
+        return
+    statement = select(Event.organizer_id, Event.going_count, Event.interested_count).where(Event.id == event_id)
+    row = (await session.exec(statement)).first()
+    if row is not None:
+        live_hub.publish(
+            event_channels(event_id, row.organizer_id), "rsvp_counts", event_id=event_id,
+            going_count=row.going_count, interested_count=row.interested_count
+        )
+
+def stream_export(statement, fmt: str, fields: List[str], filename: str) -> StreamingResponse:
+    """Stream a yield_per query as NDJSON or CSV, flushing each fetched partition."""
+    async def rows():
+        if fmt == "csv":
+            yield csv_header(fields)
+        # The request's session is closed before streaming starts, so use a dedicated one
+        async with async_session_maker() as session:
+            result = await session.stream(statement)
+            async for partition in result.partitions():
+                yield format_rows(partition, fmt)
+
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        rows(), media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    )
+
+# The handler returns pre-serialized JSON, so the shape is documented here rather than validated
+EVENT_LIST_RESPONSES = {
+    200: {
+        "model": List[Union[Event, EventCard, EventFields]],
+        "description": "Full events, cards with view=card, or id, date and the columns named in fields=",
+    }
+}
+
+@router.get("/", response_model=None, responses=EVENT_LIST_RESPONSES)
+@router.get("", response_model=None, responses=EVENT_LIST_RESPONSES)  # Handle both with and without trailing slash
 async def get_events(
-    session: Session = Depends(get_session),
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     category: Optional[str] = None,
     date: Optional[str] = None,
     location: Optional[str] = None,
     created_by: Optional[int] = None,
-    rsvp_status: Optional[str] = None
+    rsvp_status: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated event columns to return"),
+    view: Optional[str] = Query(None, pattern="^(full|card)$")
 ):
-    statement = select(Event).where(Event.is_active == True)
+    cached = response_cache.lookup("events", request)
+    if cached is not None:
+        return cached
+
+    # Only the requested columns are loaded; rows are serialized as plain dicts
+    statement = select(*event_columns(fields, view)).where(Event.is_active == True)
 
-    # Search filter
+    # Search filter (relevance-ranked unless paging by cursor)
+    ranked = bool(search) and not cursor
     if search:
-        statement = statement.where(
-            Event.title.contains(search) | Event.description.contains(search)
+        statement = apply_search(
+            statement, search, session.bind.dialect.name, ranked=ranked
         )
 
     # Category filter
@@ -37,7 +128,7 @@ async def get_events(
     # Date filter (events on the specified date only)
     if date:
         try:
-            from datetime import datetime, timedelta
+            from datetime import timedelta
             filter_date = datetime.fromisoformat(date)
             next_day = filter_date + timedelta(days=1)
             statement = statement.where(
@@ -59,28 +150,97 @@ async def get_events(
         from app.models.rsvp import RSVP
         statement = statement.join(RSVP).where(RSVP.status == rsvp_status)
 
-    statement = statement.offset(skip).limit(limit)
-    events = session.exec(statement).all()
-    return events
+    # Keyset pagination over (date, id); the next page token is sent in X-Next-Cursor
+    statement = paginate(
+        statement, (Event.date, Event.id), (datetime, int), cursor, skip, limit
+    )
+    rows = (await session.exec(statement)).all()
+    if ranked:
+        rows = rows[:limit]  # Relevance order has no stable cursor
+    else:
+        rows = finish_page(rows, limit, lambda e: (e.date, e.id), response)
+    events = [row._asdict() for row in rows]
+    return response_cache.store("events", request, events, response)
+
+@router.get("/rsvps/me", response_model=List[RSVPResponse])
+async def get_my_rsvps(
+    event_ids: Optional[List[int]] = Query(None),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Return the current user's RSVPs for a page of events in one query."""
+    statement = select(RSVP).where(RSVP.user_id == current_user.id)
+
+    if event_ids is not None:
+        if not event_ids:
+            return []
+        if len(event_ids) > 100:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="At most 100 event IDs can be requested at once"
+            )
+        statement = statement.where(RSVP.event_id.in_(event_ids))
+
+    rsvps = (await session.exec(statement)).all()
+    return rsvps
+
+@router.get("/export")
+async def export_events(
+    format: str = Query("ndjson", pattern="^(csv|ndjson)$"),
+    organizer_id: Optional[int] = None,
+    current_user: User = Depends(require_organizer_or_admin)
+):
+    """Stream active events as NDJSON or CSV without loading them all into memory."""
+    # Organizers export their own events; admins may export everyone's
+    if current_user.role != "admin":
+        organizer_id = current_user.id
+
+    return stream_export(export_statement(organizer_id), format, EXPORT_FIELDS, "events")
+
+@router.post("/import")
+async def import_events(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(require_organizer_or_admin)
+):
+    """Import events from a CSV or NDJSON upload in batched transactions, reporting bad rows."""
+    fmt = format or guess_format(file.filename)
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    report = ImportReport(current_user.id)
+
+    # Parse off the event loop; each batch is one executemany INSERT and commit
+    batches = read_batches(text, fmt, report)
+    while (batch := await run_in_threadpool(next, batches, None)) is not None:
+        await session.run_sync(import_batch, report, batch)
+
+    if report.inserted:
+        response_cache.invalidate("events")
+    return report.as_dict()
 
 @router.get("/{event_id}", response_model=Event)
 async def get_event(
     event_id: int,
-    session: Session = Depends(get_session)
+    request: Request,
+    session: AsyncSession = Depends(get_async_session)
 ):
-    event = session.get(Event, event_id)
+    cached = response_cache.lookup(f"event:{event_id}", request)
+    if cached is not None:
+        return cached
+
+    event = await session.get(Event, event_id)
     if not event or not event.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
-    return event
+    return response_cache.store(f"event:{event_id}", request, event)
 
 @router.post("/", response_model=Event)
 @router.post("", response_model=Event)  # Handle both with and without trailing slash
 async def create_event(
     event_data: EventCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(require_organizer_or_admin)
 ):
     db_event = Event(
@@ -89,18 +249,21 @@ async def create_event(
     )
 
     session.add(db_event)
-    session.commit()
-    session.refresh(db_event)
+    await session.flush()
+    await session.run_sync(index_event, db_event)
+    await session.commit()
+    await session.refresh(db_event)
+    invalidate_event_cache(db_event.id)
     return db_event
 
 @router.put("/{event_id}", response_model=Event)
 async def update_event(
     event_id: int,
     event_data: EventUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user)
 ):
-    event = session.get(Event, event_id)
+    event = await session.get(Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -119,17 +282,20 @@ async def update_event(
         setattr(event, field, value)
 
     session.add(event)
-    session.commit()
-    session.refresh(event)
+    if "title" in update_data or "description" in update_data:
+        await session.run_sync(index_event, event)
+    await session.commit()
+    await session.refresh(event)
+    invalidate_event_cache(event.id)
     return event
 
 @router.delete("/{event_id}")
 async def delete_event(
     event_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user)
 ):
-    event = session.get(Event, event_id)
+    event = await session.get(Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -145,60 +311,77 @@ async def delete_event(
 
     event.is_active = False
     session.add(event)
-    session.commit()
+    await session.run_sync(remove_event, event.id)
+    await session.commit()
+    invalidate_event_cache(event_id)
     return {"message": "Event deleted successfully"}
 
-@router.post("/{event_id}/rsvp")
+@router.post("/{event_id}/rsvp", response_model=RSVPResponse)
 async def rsvp_to_event(
     event_id: int,
     rsvp_data: RSVPCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user)
 ):
-    # Check if event exists
-    event = session.get(Event, event_id)
-    if not event or not event.is_active:
+    # One statement validates the event and inserts or updates the RSVP
+    statement = upsert_rsvp_statement(
+        session.bind.dialect.name, current_user.id, event_id, rsvp_data.status, rsvp_data.notes
+    )
+    row = (await session.exec(statement)).first()
+    if row is None:
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
 
-    # Check if user already has an RSVP
-    statement = select(RSVP).where(
-        RSVP.user_id == current_user.id,
-        RSVP.event_id == event_id
-    )
-    existing_rsvp = session.exec(statement).first()
-
-    if existing_rsvp:
-        # Update existing RSVP
-        existing_rsvp.status = rsvp_data.status
-        existing_rsvp.notes = rsvp_data.notes
-        session.add(existing_rsvp)
-        session.commit()
-        session.refresh(existing_rsvp)
-        return existing_rsvp
-    else:
-        # Create new RSVP
-        db_rsvp = RSVP(
-            user_id=current_user.id,
-            event_id=event_id,
-            status=rsvp_data.status,
-            notes=rsvp_data.notes
+    # Move the attendee counters in the same transaction; a full event rejects new GOING RSVPs
+    if not await adjust_event_counters(session, event_id, row.previous_status, row.status):
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Event is at full capacity"
+        )
+
+    await session.commit()
+    invalidate_event_cache(event_id)
+    if row.previous_status != row.status:
+        await publish_event_counts(session, event_id)
+    return row._asdict()
+
+@router.get("/{event_id}/rsvps/export")
+async def export_event_rsvps(
+    event_id: int,
+    format: str = Query("ndjson", pattern="^(csv|ndjson)$"),
+    rsvp_status: Optional[RSVPStatus] = Query(None, alias="status"),
+    checked_in: Optional[bool] = None,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Stream an event's attendee list, optionally filtered by RSVP status and check-in state."""
+    event = await session.get(Event, event_id)
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
         )
-        session.add(db_rsvp)
-        session.commit()
-        session.refresh(db_rsvp)
-        return db_rsvp
+    if event.organizer_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to export attendees for this event"
+        )
+
+    statement = attendee_export_statement(event_id, rsvp_status, checked_in)
+    return stream_export(statement, format, ATTENDEE_EXPORT_FIELDS, f"event-{event_id}-attendees")
 
 @router.get("/{event_id}/rsvps")
 async def get_event_rsvps(
     event_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user)
 ):
     # Check if event exists
-    event = session.get(Event, event_id)
+    event = await session.get(Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -209,7 +392,7 @@ async def get_event_rsvps(
     if event.organizer_id == current_user.id or current_user.role == "admin":
         # Get RSVPs with user information for organizer/admin
         statement = select(RSVP, User).join(User).where(RSVP.event_id == event_id)
-        results = session.exec(statement).all()
+        results = (await session.exec(statement)).all()
         
         rsvps_with_users = []
         for rsvp, user in results:
@@ -240,7 +423,7 @@ async def get_event_rsvps(
             RSVP.event_id == event_id,
             RSVP.user_id == current_user.id
         )
-        user_rsvp = session.exec(statement).first()
+        user_rsvp = (await session.exec(statement)).first()
         
         if user_rsvp:
             return [{
@@ -255,4 +438,77 @@ async def get_event_rsvps(
                 "checked_in_at": user_rsvp.checked_in_at
             }]
         else:
-            return []
\ No newline at end of file
+            return []
+
+@router.get("/rsvps/report")
+async def get_rsvp_report(
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(require_admin),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    include_attendees: bool = False
+):
+    """Admin report of RSVP counts per event, paginated by event."""
+    def count_status(rsvp_status: RSVPStatus):
+        return func.coalesce(
+            func.sum(case((RSVP.status == rsvp_status, 1), else_=0)), 0
+        )
+
+    statement = (
+        select(
+            Event,
+            count_status(RSVPStatus.GOING).label("going"),
+            count_status(RSVPStatus.INTERESTED).label("interested"),
+            count_status(RSVPStatus.NOT_GOING).label("not_going")
+        )
+        .outerjoin(RSVP, RSVP.event_id == Event.id)
+        .where(Event.is_active == True)
+        .group_by(Event.id)
+        .order_by(Event.date, Event.id)
+        .offset(skip)
+        .limit(limit + 1)
+    )
+    rows = (await session.exec(statement)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    report = []
+    for event, going, interested, not_going in rows:
+        report.append({
+            **event.dict(),
+            "rsvp_counts": {
+                "going": going,
+                "interested": interested,
+                "not_going": not_going
+            }
+        })
+
+    if include_attendees and report:
+        attendees = {item["id"]: [] for item in report}
+        statement = (
+            select(RSVP, User.full_name, User.email)
+            .join(User, RSVP.user_id == User.id)
+            .where(RSVP.event_id.in_(list(attendees)))
+        )
+        for rsvp, full_name, email in (await session.exec(statement)).all():
+            attendees[rsvp.event_id].append({
+                "id": rsvp.id,
+                "user_id": rsvp.user_id,
+                "status": rsvp.status,
+                "notes": rsvp.notes,
+                "checked_in": rsvp.checked_in,
+                "user": {
+                    "id": rsvp.user_id,
+                    "email": email,
+                    "full_name": full_name
+                }
+            })
+        for item in report:
+            item["rsvps"] = attendees[item["id"]]
+
+    return {
+        "events": report,
+        "skip": skip,
+        "limit": limit,
+        "has_more": has_more
+    }
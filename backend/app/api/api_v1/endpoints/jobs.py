@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy import func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db.database import get_async_session
+from app.models.job import Job, JobStatus
+from app.models.user import User
+from app.core.auth import require_admin
+from app.core.jobs import enqueue, job_worker
+
+router = APIRouter()
+
+@router.get("/stats")
+async def get_job_stats(
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(require_admin)
+):
+    """Admin endpoint: queued job counts by kind and status."""
+    statement = select(Job.kind, Job.status, func.count(Job.id)).group_by(Job.kind, Job.status)
+    stats = {}
+    for kind, job_status, count in (await session.exec(statement)).all():
+        stats.setdefault(kind, {status.value: 0 for status in JobStatus})[job_status.value] = count
+    return stats
+
+@router.post("/reminders")
+async def schedule_reminders_now(
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(require_admin)
+):
+    """Admin endpoint: queue a reminder scan now instead of waiting for the next interval."""
+    await enqueue(session, "schedule_reminders", {})
+    await session.commit()
+    job_worker.wake()
+    return {"message": "Reminder scan queued"}
@@ -0,0 +1,83 @@
+import asyncio
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from app.core.auth import authenticate_token
+from app.core.config import settings
+from app.core.live import Subscription, live_hub
+from app.models.user import UserRole
+
+router = APIRouter()
+
+def open_subscription(channels: List[str]) -> Subscription:
+    if not live_hub.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Live updates are disabled"
+        )
+    subscription = live_hub.subscribe(channels)
+    if subscription is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many live connections, please retry",
+            headers={"Retry-After": "5"}
+        )
+    return subscription
+
+def sse_response(request: Request, subscription: Subscription) -> StreamingResponse:
+    """Stream a subscription as Server-Sent Events, with heartbeats to detect gone clients."""
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=settings.LIVE_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {message['type']}\ndata: {orjson.dumps(message).decode()}\n\n"
+        finally:
+            live_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/events")
+async def live_events(
+    request: Request,
+    ids: List[int] = Query(...)
+):
+    """Public stream of RSVP counts, approved comments and check-in counts for up to 100 events."""
+    if len(ids) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At most 100 events can be followed at once"
+        )
+    subscription = open_subscription([f"event:{event_id}" for event_id in set(ids)])
+    return sse_response(request, subscription)
+
+@router.get("/organizer")
+async def live_organizer(
+    request: Request,
+    token: str,
+    organizer_id: Optional[int] = None
+):
+    """Stream updates for all of an organizer's events; the access token is passed as a query parameter."""
+    current_user = await authenticate_token(token)
+    if organizer_id is None or current_user.role != UserRole.ADMIN:
+        if current_user.role not in [UserRole.ORGANIZER, UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Organizer or admin access required"
+            )
+        organizer_id = current_user.id
+    subscription = open_subscription([f"organizer:{organizer_id}"])
+    return sse_response(request, subscription)
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+from app.models.user import User
+from app.core.auth import require_admin
+from app.core.config import settings
+from app.core.profiler import query_profiler
+
+router = APIRouter()
+
+@router.get("/queries")
+async def get_query_findings(
+    current_user: User = Depends(require_admin)
+):
+    """Admin endpoint: slow and N+1 statements seen by this worker, by normalized statement."""
+    return {
+        "enabled": settings.SQL_PROFILER_ENABLED,
+        "slow_query_ms": query_profiler.slow_ms,
+        "n_plus_one_threshold": query_profiler.n_plus_one_threshold,
+        "dropped": query_profiler.dropped,
+        "findings": query_profiler.findings(),
+    }
+
+@router.delete("/queries")
+async def reset_query_findings(
+    current_user: User = Depends(require_admin)
+):
+    """Admin endpoint: clear the findings, e.g. after deploying a fix."""
+    query_profiler.reset()
+    return {"message": "Query findings cleared"}
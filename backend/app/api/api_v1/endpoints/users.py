@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session, select
-from typing import List
-from app.db.database import get_session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
+from app.db.database import get_async_session
 from app.models.user import User, UserUpdate
-from app.core.auth import get_current_active_user, require_admin
+from app.core.auth import auth_cache_stats, get_current_active_user, invalidate_user, require_admin
+from app.core.pagination import finish_page, paginate
 
 router = APIRouter()
 
@@ -23,20 +25,21 @@ async def get_current_user(
 @router.put("/me")
 async def update_current_user(
     user_data: UserUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user)
 ):
     update_data = user_data.dict(exclude_unset=True)
     for field, value in update_data.items():
         if field == "password" and value:
-            from app.core.auth import get_password_hash
-            setattr(current_user, "hashed_password", get_password_hash(value))
+            from app.core.auth import get_password_hash_async
+            setattr(current_user, "hashed_password", await get_password_hash_async(value))
         elif field != "password":
             setattr(current_user, field, value)
 
     session.add(current_user)
-    session.commit()
-    session.refresh(current_user)
+    await session.commit()
+    await session.refresh(current_user)
+    invalidate_user(current_user.id)
 
     return {
         "id": current_user.id,
@@ -48,22 +51,31 @@ async def update_current_user(
 
 @router.get("/", response_model=List[User])
 async def get_all_users(
-    session: Session = Depends(get_session),
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(require_admin),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100)
+    limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None
 ):
-    statement = select(User).offset(skip).limit(limit)
-    users = session.exec(statement).all()
-    return users
+    statement = paginate(select(User), (User.id,), (int,), cursor, skip, limit)
+    users = (await session.exec(statement)).all()
+    return finish_page(users, limit, lambda u: (u.id,), response)
+
+@router.get("/auth-cache")
+async def get_auth_cache_stats(
+    current_user: User = Depends(require_admin)
+):
+    """Admin endpoint showing how many user lookups the auth cache saved."""
+    return auth_cache_stats()
 
 @router.get("/{user_id}")
 async def get_user(
     user_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(require_admin)
 ):
-    user = session.get(User, user_id)
+    user = await session.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,20 +1,38 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session, select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.db.database import get_session
+from app.db.database import async_session_maker, get_async_session
 from app.models.user import User, UserRole
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so a small thread pool keeps it off the event loop
+hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+# Jobs running or waiting in the pool; only touched from the event loop
+_hash_jobs = 0
+
 # JWT token security
 security = HTTPBearer()
 
+# Decoded tokens keyed by token hash, and user rows keyed by user id
+token_cache = TTLCache(settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+user_cache = TTLCache(settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -23,6 +41,31 @@ def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
 
+async def _run_in_hash_pool(func, *args):
+    """Run a bcrypt call in the hash pool, failing fast with 503 when it is saturated."""
+    global _hash_jobs
+    if _hash_jobs >= settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again",
+            headers={"Retry-After": "1"},
+        )
+
+    _hash_jobs += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(hash_executor, func, *args)
+    finally:
+        _hash_jobs -= 1
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the hash pool."""
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the hash pool."""
+    return await _run_in_hash_pool(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -43,9 +86,30 @@ def verify_token(token: str) -> Optional[dict]:
     except JWTError:
         return None
 
+def verify_token_cached(token: str) -> Optional[dict]:
+    """Verify a JWT token, reusing the decoded payload for repeat requests."""
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = token_cache.get(key)
+    if payload is None:
+        payload = verify_token(token)
+        if payload is None:
+            return None
+        # Never serve a cached token past its own expiry
+        ttl = payload["exp"] - time.time() if "exp" in payload else None
+        token_cache.set(key, payload, ttl=ttl)
+    return payload
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a user's cached row after it has been changed."""
+    user_cache.delete(user_id)
+
+def auth_cache_stats() -> dict:
+    """Hit/miss counters for the token and user caches."""
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ) -> User:
     """Get the current authenticated user."""
     credentials_exception = HTTPException(
@@ -55,21 +119,40 @@ async def get_current_user(
     )
     
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = verify_token_cached(token)
     
     if payload is None:
         raise credentials_exception
     
-    user_id: int = payload.get("sub")
-    if user_id is None:
+    try:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
         raise credentials_exception
     
-    statement = select(User).where(User.id == user_id)
-    user = session.exec(statement).first()
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        # Attach a copy to this request's session without a SELECT
+        user = User(**cached)
+        make_transient_to_detached(user)
+        return await session.merge(user, load=False)
+    
+    user = await session.get(User, user_id)
     
     if user is None:
         raise credentials_exception
     
+    user_cache.set(user_id, user.dict())
+    return user
+
+async def authenticate_token(token: str) -> User:
+    """Resolve an access token passed outside the Authorization header (EventSource cannot set headers).
+
+    Uses its own short-lived session so long-lived streams do not hold a connection.
+    """
+    async with async_session_maker() as session:
+        user = await get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token), session)
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
     return user
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
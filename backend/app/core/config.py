@@ -9,6 +9,37 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = config("DATABASE_URL", default="sqlite:///./eventify.db")
+
+    @property
+    def async_database_url(self) -> str:
+        """DATABASE_URL with its asyncio driver (aiosqlite / asyncpg)."""
+        scheme, _, rest = self.DATABASE_URL.partition("://")
+        backend = scheme.split("+")[0]
+        if backend == "sqlite":
+            return f"sqlite+aiosqlite://{rest}"
+        if backend in ("postgresql", "postgres"):
+            return f"postgresql+asyncpg://{rest}"
+        return self.DATABASE_URL
+    
+    # SQLite connection pragmas (applied to every connection)
+    SQLITE_JOURNAL_MODE: str = config("SQLITE_JOURNAL_MODE", default="WAL")
+    SQLITE_SYNCHRONOUS: str = config("SQLITE_SYNCHRONOUS", default="NORMAL")
+    SQLITE_MMAP_SIZE: int = config("SQLITE_MMAP_SIZE", default=268435456, cast=int)  # 256 MiB
+    SQLITE_CACHE_SIZE: int = config("SQLITE_CACHE_SIZE", default=-65536, cast=int)  # Negative means KiB
+    SQLITE_BUSY_TIMEOUT_MS: int = config("SQLITE_BUSY_TIMEOUT_MS", default=5000, cast=int)
+
+    # Connection pool for server databases (Postgres)
+    DB_POOL_SIZE: int = config("DB_POOL_SIZE", default=10, cast=int)
+    DB_MAX_OVERFLOW: int = config("DB_MAX_OVERFLOW", default=20, cast=int)
+    DB_POOL_RECYCLE: int = config("DB_POOL_RECYCLE", default=1800, cast=int)  # Seconds
+    DB_POOL_PRE_PING: bool = config("DB_POOL_PRE_PING", default=True, cast=bool)
+    
+    # Response cache for public event reads: "memory" (per worker), "sqlite" (shared
+    # by all workers on the host through RESPONSE_CACHE_PATH) or "none"
+    RESPONSE_CACHE_BACKEND: str = config("RESPONSE_CACHE_BACKEND", default="memory")
+    RESPONSE_CACHE_PATH: str = config("RESPONSE_CACHE_PATH", default="./response_cache.db")
+    RESPONSE_CACHE_SIZE: int = config("RESPONSE_CACHE_SIZE", default=512, cast=int)
+    RESPONSE_CACHE_TTL_SECONDS: int = config("RESPONSE_CACHE_TTL_SECONDS", default=30, cast=int)
     
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = ["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -27,6 +58,66 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours for development
 
+    # Password hashing pool (bcrypt runs off the event loop)
+    PASSWORD_HASH_WORKERS: int = config("PASSWORD_HASH_WORKERS", default=4, cast=int)
+    PASSWORD_HASH_MAX_QUEUE: int = config("PASSWORD_HASH_MAX_QUEUE", default=32, cast=int)
+
+    # In-process cache of decoded tokens and user rows for get_current_user
+    AUTH_CACHE_SIZE: int = config("AUTH_CACHE_SIZE", default=1024, cast=int)
+    AUTH_CACHE_TTL_SECONDS: int = config("AUTH_CACHE_TTL_SECONDS", default=60, cast=int)
+
+    # Signed door check-in codes; CHECKIN_SECRET_KEY falls back to SECRET_KEY
+    CHECKIN_SECRET_KEY: str = config("CHECKIN_SECRET_KEY", default="")
+    CHECKIN_BATCH_MAX: int = config("CHECKIN_BATCH_MAX", default=500, cast=int)
+
+    # Bulk event import/export: rows per INSERT batch / per streamed fetch
+    BULK_BATCH_SIZE: int = config("BULK_BATCH_SIZE", default=500, cast=int)
+    IMPORT_MAX_ERRORS: int = config("IMPORT_MAX_ERRORS", default=1000, cast=int)  # Rows listed in the error report
+
+    # Live updates over SSE: "memory" (per worker), "sqlite" (fan-out to all workers
+    # on the host through LIVE_PATH) or "none"
+    LIVE_BACKEND: str = config("LIVE_BACKEND", default="memory")
+    LIVE_PATH: str = config("LIVE_PATH", default="./live_updates.db")
+    LIVE_POLL_INTERVAL_MS: int = config("LIVE_POLL_INTERVAL_MS", default=250, cast=int)
+    LIVE_QUEUE_SIZE: int = config("LIVE_QUEUE_SIZE", default=100, cast=int)  # Per client, then resync
+    LIVE_MAX_SUBSCRIBERS: int = config("LIVE_MAX_SUBSCRIBERS", default=1000, cast=int)  # Per worker
+    LIVE_HEARTBEAT_SECONDS: int = config("LIVE_HEARTBEAT_SECONDS", default=15, cast=int)
+
+    # Background jobs, persisted in the job table and run by every API worker
+    JOB_WORKER_ENABLED: bool = config("JOB_WORKER_ENABLED", default=True, cast=bool)
+    JOB_CONCURRENCY: int = config("JOB_CONCURRENCY", default=4, cast=int)
+    JOB_POLL_INTERVAL_MS: int = config("JOB_POLL_INTERVAL_MS", default=1000, cast=int)
+    JOB_MAX_ATTEMPTS: int = config("JOB_MAX_ATTEMPTS", default=5, cast=int)
+    JOB_RETRY_BASE_SECONDS: int = config("JOB_RETRY_BASE_SECONDS", default=30, cast=int)  # Doubles per attempt
+    JOB_LOCK_TIMEOUT_SECONDS: int = config("JOB_LOCK_TIMEOUT_SECONDS", default=300, cast=int)  # Reclaim after a crash
+    JOB_RETENTION_DAYS: int = config("JOB_RETENTION_DAYS", default=7, cast=int)
+
+    # Event reminders
+    REMINDER_LEAD_HOURS: int = config("REMINDER_LEAD_HOURS", default=24, cast=int)
+    REMINDER_SCAN_INTERVAL_SECONDS: int = config("REMINDER_SCAN_INTERVAL_SECONDS", default=300, cast=int)
+    REMINDER_BATCH_SIZE: int = config("REMINDER_BATCH_SIZE", default=100, cast=int)  # Events per scan batch
+
+    # Outgoing mail (python -m app.core.mail runs a local SMTP sink on this port)
+    SMTP_HOST: str = config("SMTP_HOST", default="localhost")
+    SMTP_PORT: int = config("SMTP_PORT", default=1025, cast=int)
+    MAIL_FROM: str = config("MAIL_FROM", default="EventiFy <no-reply@eventify.local>")
+    MAIL_SINK_DIR: str = config("MAIL_SINK_DIR", default="./mail_sink")
+
+    # Prometheus metrics on /metrics (per worker process)
+    METRICS_ENABLED: bool = config("METRICS_ENABLED", default=True, cast=bool)
+
+    # Opt-in SQL profiler: slow query log with EXPLAIN plans and N+1 detection
+    SQL_PROFILER_ENABLED: bool = config("SQL_PROFILER_ENABLED", default=False, cast=bool)
+    SQL_SLOW_QUERY_MS: float = config("SQL_SLOW_QUERY_MS", default=100, cast=float)
+    SQL_N_PLUS_ONE_THRESHOLD: int = config("SQL_N_PLUS_ONE_THRESHOLD", default=10, cast=int)  # Same shape per request
+    SQL_PROFILER_MAX_FINDINGS: int = config("SQL_PROFILER_MAX_FINDINGS", default=500, cast=int)
+
+    # Startup: "auto" migrates only when the stored schema version is behind, "always"
+    # runs the Alembic upgrade on every boot, "skip" leaves migrations to the deploy
+    STARTUP_MIGRATIONS: str = config("STARTUP_MIGRATIONS", default="auto")
+    # Demo data is seeded with python -m app.db.init_db; set this to seed empty databases on boot
+    SEED_ON_STARTUP: bool = config("SEED_ON_STARTUP", default=False, cast=bool)
+
     class Config:
         case_sensitive = True
 
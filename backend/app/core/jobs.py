@@ -0,0 +1,212 @@
+import asyncio
+import traceback
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+from sqlalchemy import and_, delete, or_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.config import settings
+from app.db.database import async_session_maker
+from app.db.rsvps import UPSERT_DIALECTS
+from app.models.job import Job, JobStatus
+
+JobHandler = Callable[[dict], Awaitable[None]]
+
+# Registered handlers by job kind
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+def job_handler(kind: str):
+    """Register an async handler for a job kind; it receives the job payload."""
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = handler
+        return handler
+    return register
+
+def job_row(kind: str, payload: dict, run_at: Optional[datetime] = None, dedupe_key: Optional[str] = None) -> dict:
+    now = datetime.utcnow()
+    return {
+        "kind": kind,
+        "payload": payload,
+        "status": JobStatus.PENDING,
+        "attempts": 0,
+        "max_attempts": settings.JOB_MAX_ATTEMPTS,
+        "run_at": run_at or now,
+        "dedupe_key": dedupe_key,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+async def enqueue_jobs(session: AsyncSession, rows: List[dict]) -> None:
+    """Insert job_row()s in the caller's transaction, skipping dedupe keys that already exist."""
+    if not rows:
+        return
+    insert = UPSERT_DIALECTS[session.bind.dialect.name]
+    await session.exec(
+        insert(Job.__table__).on_conflict_do_nothing(index_elements=["dedupe_key"]),
+        params=rows
+    )
+
+async def enqueue(session: AsyncSession, kind: str, payload: dict, **options) -> None:
+    """Queue one job; it becomes visible to workers when the caller commits."""
+    await enqueue_jobs(session, [job_row(kind, payload, **options)])
+
+async def claim_jobs(session: AsyncSession, limit: int) -> List[Job]:
+    """Mark up to limit due jobs as running and return them.
+
+    Running jobs whose lock expired (their worker died) are claimed again.
+    """
+    now = datetime.utcnow()
+    due = or_(
+        and_(Job.status == JobStatus.PENDING, Job.run_at <= now),
+        and_(
+            Job.status == JobStatus.RUNNING,
+            Job.locked_at < now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+        ),
+    )
+    candidates = (
+        select(Job.id).where(due).order_by(Job.run_at, Job.id).limit(limit)
+        .with_for_update(skip_locked=True)  # Postgres; SQLite serializes writers instead
+    )
+    result = await session.exec(
+        update(Job)
+        .where(Job.id.in_(candidates.scalar_subquery()), due)
+        .values(status=JobStatus.RUNNING, locked_at=now, attempts=Job.attempts + 1, updated_at=now)
+        .returning(Job)
+        .execution_options(synchronize_session=False)
+    )
+    jobs = list(result.scalars().all())
+    await session.commit()
+    return jobs
+
+async def finish_job(session: AsyncSession, job: Job, error: Optional[str] = None) -> None:
+    """Record a job's outcome; failures are retried with exponential backoff."""
+    now = datetime.utcnow()
+    if error is None:
+        values = {"status": JobStatus.DONE, "last_error": None}
+    elif job.attempts < job.max_attempts:
+        delay = settings.JOB_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1)
+        values = {"status": JobStatus.PENDING, "run_at": now + timedelta(seconds=delay), "last_error": error}
+    else:
+        values = {"status": JobStatus.FAILED, "last_error": error}
+    await session.exec(
+        update(Job)
+        .where(Job.id == job.id)
+        .values(locked_at=None, updated_at=now, **values)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+async def prune_jobs(session: AsyncSession) -> int:
+    """Delete finished jobs past JOB_RETENTION_DAYS (their dedupe keys go with them)."""
+    cutoff = datetime.utcnow() - timedelta(days=settings.JOB_RETENTION_DAYS)
+    result = await session.exec(
+        delete(Job)
+        .where(Job.status.in_([JobStatus.DONE, JobStatus.FAILED]), Job.updated_at < cutoff)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+async def run_job(job: Job) -> None:
+    handler = JOB_HANDLERS.get(job.kind)
+    error = None
+    try:
+        if handler is None:
+            raise LookupError(f"No handler for job kind {job.kind!r}")
+        await handler(job.payload)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        print(f"Job {job.id} ({job.kind}) attempt {job.attempts} failed: {error}")
+        traceback.print_exc()
+    async with async_session_maker() as session:
+        await finish_job(session, job, error)
+
+class JobWorker:
+    """Polls the job table and runs up to JOB_CONCURRENCY jobs at a time on the event loop.
+
+    Every API worker can run one; claims are atomic, so each job runs once.
+    Periodic tasks registered with every() are enqueued once per interval across workers.
+    """
+
+    def __init__(self, concurrency: int, poll_interval: float):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.periodic: List[tuple] = []
+        self._running: set = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+
+    def every(self, seconds: int, kind: str, payload: Optional[dict] = None) -> None:
+        self.periodic.append((seconds, kind, payload or {}))
+
+    def _job_done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        self._wake.set()  # A slot is free
+
+    def wake(self) -> None:
+        """Poll immediately instead of waiting out the interval."""
+        self._wake.set()
+
+    async def _enqueue_periodic(self, session: AsyncSession) -> None:
+        now = datetime.utcnow().timestamp()
+        rows = [
+            job_row(kind, payload, dedupe_key=f"periodic:{kind}:{int(now // seconds)}")
+            for seconds, kind, payload in self.periodic
+        ]
+        await enqueue_jobs(session, rows)
+        await session.commit()
+
+    async def run(self) -> None:
+        next_periodic = 0.0
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                async with async_session_maker() as session:
+                    if loop.time() >= next_periodic:
+                        await self._enqueue_periodic(session)
+                        await prune_jobs(session)
+                        next_periodic = loop.time() + 60
+                    free = self.concurrency - len(self._running)
+                    jobs = await claim_jobs(session, free) if free > 0 else []
+                for job in jobs:
+                    task = loop.create_task(run_job(job))
+                    self._running.add(task)
+                    task.add_done_callback(self._job_done)
+            except Exception as e:
+                print(f"Job worker poll failed: {e}")
+                jobs = []
+            if len(jobs) < self.concurrency:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop polling and let in-flight jobs finish (unfinished ones are reclaimed later)."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._running:
+            await asyncio.wait(self._running, timeout=settings.JOB_LOCK_TIMEOUT_SECONDS)
+
+job_worker = JobWorker(settings.JOB_CONCURRENCY, settings.JOB_POLL_INTERVAL_MS / 1000)
+
+async def main() -> None:
+    """Run a standalone worker: python -m app.core.jobs"""
+    import app.core.reminders  # noqa: F401 - registers the reminder handlers
+    job_worker.start()
+    print(f"Job worker running with concurrency {job_worker.concurrency}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await job_worker.stop()
+
+if __name__ == "__main__":
+    # Run the imported module's main so handlers register on the same JOB_HANDLERS
+    from app.core.jobs import main as run_worker
+    asyncio.run(run_worker())
@@ -0,0 +1,206 @@
+import asyncio
+import json
+import sqlite3
+import time
+from collections import defaultdict, deque
+from typing import Dict, Iterable, Optional, Protocol, Set
+from fastapi.encoders import jsonable_encoder
+from app.core.config import settings
+
+# Sent in place of queued messages a slow client could not keep up with
+RESYNC = {"type": "resync"}
+
+class Subscription:
+    """A client's bounded message queue.
+
+    When the queue is full the backlog is replaced by a single resync message,
+    so a slow client costs bounded memory and knows to refetch instead.
+    """
+
+    def __init__(self, channels: Set[str], maxsize: int):
+        self.channels = channels
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.resyncs = 0
+
+    def deliver(self, message: dict) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+            self.resyncs += 1
+
+class LiveBackend(Protocol):
+    """Carries published messages to every worker's hub."""
+
+    def publish(self, channel: str, message: dict) -> None: ...
+    async def run(self, hub: "LiveHub") -> None: ...
+
+class MemoryBackend:
+    """Delivers within this process only."""
+
+    def __init__(self):
+        self.hub: Optional["LiveHub"] = None
+
+    def publish(self, channel: str, message: dict) -> None:
+        if self.hub is not None:
+            self.hub.dispatch(channel, message)
+
+    async def run(self, hub: "LiveHub") -> None:
+        self.hub = hub
+
+class SQLiteBackend:
+    """Fan out through a local SQLite file that every worker on the host polls.
+
+    Stands in for a networked pub/sub such as Redis; messages are kept for a minute.
+    publish() only queues in memory: the run() task writes the outbox and reads new
+    messages in a worker thread, so a busy file never stalls the event loop.
+    """
+
+    RETENTION_SECONDS = 60
+    OUTBOX_SIZE = 10000  # Oldest unwritten messages are dropped past this
+
+    def __init__(self, path: str, poll_interval: float):
+        self.poll_interval = poll_interval
+        self.dropped = 0
+        self._outbox: deque = deque()
+        self._wake = asyncio.Event()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=1000")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS live_message ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL, "
+            "message TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+
+    def publish(self, channel: str, message: dict) -> None:
+        if len(self._outbox) >= self.OUTBOX_SIZE:
+            self._outbox.popleft()
+            self.dropped += 1
+        self._outbox.append((channel, json.dumps(message), time.time()))
+        self._wake.set()
+
+    def _exchange(self, outgoing: list, after: int, prune: bool) -> list:
+        """Write queued messages and read everything newer than after; runs off the event loop."""
+        if outgoing:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO live_message (channel, message, created_at) VALUES (?, ?, ?)", outgoing
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        if prune:
+            self._conn.execute(
+                "DELETE FROM live_message WHERE created_at < ?", (time.time() - self.RETENTION_SECONDS,)
+            )
+        return self._conn.execute(
+            "SELECT id, channel, message FROM live_message WHERE id > ? ORDER BY id", (after,)
+        ).fetchall()
+
+    async def run(self, hub: "LiveHub") -> None:
+        last_id = (await asyncio.to_thread(
+            lambda: self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM live_message").fetchone()
+        ))[0]
+        next_prune = 0.0
+        while True:
+            outgoing = list(self._outbox)
+            self._outbox.clear()
+            prune = time.monotonic() >= next_prune
+            try:
+                rows = await asyncio.to_thread(self._exchange, outgoing, last_id, prune)
+            except sqlite3.Error as e:
+                print(f"Live update poll failed: {e}")
+                # Keep unwritten messages for the next attempt, ahead of newer ones
+                self._outbox.extendleft(reversed(outgoing))
+                rows = []
+                await asyncio.sleep(self.poll_interval)
+            else:
+                if prune:
+                    next_prune = time.monotonic() + self.RETENTION_SECONDS
+            for message_id, channel, message in rows:
+                hub.dispatch(channel, json.loads(message))
+                last_id = message_id
+            if not self._outbox:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._wake.clear()
+
+class LiveHub:
+    """In-process pub/sub of live updates, keyed by channel ("event:1", "organizer:2")."""
+
+    def __init__(self, backend: Optional[LiveBackend]):
+        self.backend = backend
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def subscriber_count(self) -> int:
+        return len({sub for subs in self._subscribers.values() for sub in subs})
+
+    def _ensure_started(self) -> None:
+        # A backend's run() may finish once set up; only a crashed or stopped one is restarted
+        task = self._task
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            self._task = asyncio.get_running_loop().create_task(self.backend.run(self))
+
+    def subscribe(self, channels: Iterable[str]) -> Optional[Subscription]:
+        """Register a subscription, or return None when the worker is at LIVE_MAX_SUBSCRIBERS."""
+        if self.subscriber_count() >= settings.LIVE_MAX_SUBSCRIBERS:
+            return None
+        self._ensure_started()
+        subscription = Subscription(set(channels), settings.LIVE_QUEUE_SIZE)
+        for channel in subscription.channels:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for channel in subscription.channels:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def dispatch(self, channel: str, message: dict) -> None:
+        for subscription in list(self._subscribers.get(channel, ())):
+            subscription.deliver(message)
+
+    def publish(self, channels: Iterable[str], type: str, **data) -> None:
+        """Send a message to every subscriber of the given channels, on all workers."""
+        if self.backend is None:
+            return
+        # The backend's task carries messages to other workers, so start it on first use
+        self._ensure_started()
+        message = jsonable_encoder({"type": type, **data})
+        for channel in channels:
+            self.backend.publish(channel, message)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+def event_channels(event_id: int, organizer_id: Optional[int] = None) -> list:
+    channels = [f"event:{event_id}"]
+    if organizer_id is not None:
+        channels.append(f"organizer:{organizer_id}")
+    return channels
+
+def _make_backend() -> Optional[LiveBackend]:
+    if settings.LIVE_BACKEND == "memory":
+        return MemoryBackend()
+    if settings.LIVE_BACKEND == "sqlite":
+        return SQLiteBackend(settings.LIVE_PATH, settings.LIVE_POLL_INTERVAL_MS / 1000)
+    return None
+
+live_hub = LiveHub(_make_backend())
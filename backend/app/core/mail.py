@@ -0,0 +1,90 @@
+import asyncio
+import smtplib
+from datetime import datetime
+from email.message import EmailMessage
+from pathlib import Path
+from app.core.config import settings
+
+def build_message(to: str, subject: str, body: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = settings.MAIL_FROM
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    return message
+
+def _send(message: EmailMessage) -> None:
+    with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=10) as smtp:
+        smtp.send_message(message)
+
+async def send_mail(to: str, subject: str, body: str) -> None:
+    """Deliver a plain-text email over SMTP without blocking the event loop."""
+    await asyncio.to_thread(_send, build_message(to, subject, body))
+
+class SMTPSink:
+    """Minimal SMTP server that accepts every message and saves it as an .eml file.
+
+    A local stand-in for a mail relay during development and tests.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.received = 0
+
+    def save(self, sender: str, recipients: list, data: bytes) -> Path:
+        self.received += 1
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        path = self.directory / f"{stamp}-{self.received}.eml"
+        path.write_bytes(data)
+        print(f"Mail from {sender} to {', '.join(recipients)} saved to {path}")
+        return path
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        sender, recipients = None, []
+        await reply("220 eventify-sink ESMTP")
+        try:
+            while line := await reader.readline():
+                command = line.decode(errors="replace").strip()
+                verb = command[:4].upper()
+                if verb in ("HELO", "EHLO"):
+                    await reply("250 eventify-sink")
+                elif verb == "MAIL":
+                    sender, recipients = command.partition(":")[2].strip(), []
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    recipients.append(command.partition(":")[2].strip())
+                    await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    lines = []
+                    while (data := await reader.readline()) not in (b".\r\n", b".\n", b""):
+                        lines.append(data[1:] if data.startswith(b"..") else data)
+                    self.save(sender, recipients, b"".join(lines))
+                    sender, recipients = None, []
+                    await reply("250 OK: queued")
+                elif verb == "RSET":
+                    sender, recipients = None, []
+                    await reply("250 OK")
+                elif verb == "NOOP":
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"SMTP sink listening on {host}:{port}, saving to {self.directory}")
+        async with server:
+            await server.serve_forever()
+
+if __name__ == "__main__":
+    asyncio.run(SMTPSink(settings.MAIL_SINK_DIR).serve(settings.SMTP_HOST, settings.SMTP_PORT))
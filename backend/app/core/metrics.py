@@ -0,0 +1,168 @@
+import bisect
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+from sqlalchemy import event
+
+# Upper bounds of the histogram buckets; +Inf is implied
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# Route label for requests that matched no route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "<unmatched>"
+
+class Histogram:
+    """Observation counts per bucket plus a running sum, rendered cumulatively."""
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+class RequestStats:
+    """SQL work done while serving one request, filled in by the engine listeners."""
+
+    __slots__ = ("queries", "query_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info["query_started_at"] = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    started_at = conn.info.pop("query_started_at", None)
+    if stats is not None and started_at is not None:
+        stats.queries += 1
+        stats.query_seconds += time.perf_counter() - started_at
+
+def instrument_engine(sync_engine) -> None:
+    """Count statements and their time against the request that runs them."""
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class MetricsRegistry:
+    """Per-process request metrics; each worker is scraped as its own instance."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.latency: Dict[Tuple[str, str], Histogram] = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.query_counts: Dict[Tuple[str, str], Histogram] = defaultdict(lambda: Histogram(QUERY_COUNT_BUCKETS))
+        self.query_seconds: Dict[Tuple[str, str], float] = defaultdict(float)
+        self.responses: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        self.startup_seconds: Dict[str, float] = {}
+
+    def record_startup(self, phases: Dict[str, float]) -> None:
+        with self._lock:
+            self.startup_seconds = dict(phases)
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        key = (method, route)
+        with self._lock:
+            self.latency[key].observe(seconds)
+            self.query_counts[key].observe(stats.queries)
+            self.query_seconds[key] += stats.query_seconds
+            self.responses[(method, route, status)] += 1
+
+    def _histogram_lines(self, name: str, histograms: Dict[Tuple[str, str], Histogram]) -> list:
+        lines = []
+        for (method, route), histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                cumulative += count
+                le = bound if bound == "+Inf" else _number(bound)
+                lines.append(f"{name}_bucket{_labels(method=method, route=route, le=le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(method=method, route=route)} {_number(histogram.sum)}")
+            lines.append(f"{name}_count{_labels(method=method, route=route)} {cumulative}")
+        return lines
+
+    def render(self) -> str:
+        """The registry in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                "# HELP eventify_http_requests_in_flight HTTP requests currently being served.",
+                "# TYPE eventify_http_requests_in_flight gauge",
+                f"eventify_http_requests_in_flight {self.in_flight}",
+                "# HELP eventify_http_request_duration_seconds Time to serve a request, including streamed bodies.",
+                "# TYPE eventify_http_request_duration_seconds histogram",
+                *self._histogram_lines("eventify_http_request_duration_seconds", self.latency),
+                "# HELP eventify_http_responses_total Responses by status code.",
+                "# TYPE eventify_http_responses_total counter",
+                *(
+                    f"eventify_http_responses_total{_labels(method=method, route=route, status=status)} {count}"
+                    for (method, route, status), count in sorted(self.responses.items())
+                ),
+                "# HELP eventify_http_request_db_queries SQL statements executed per request.",
+                "# TYPE eventify_http_request_db_queries histogram",
+                *self._histogram_lines("eventify_http_request_db_queries", self.query_counts),
+                "# HELP eventify_http_request_db_seconds_total Time spent executing SQL statements.",
+                "# TYPE eventify_http_request_db_seconds_total counter",
+                *(
+                    f"eventify_http_request_db_seconds_total{_labels(method=method, route=route)} {_number(seconds)}"
+                    for (method, route), seconds in sorted(self.query_seconds.items())
+                ),
+                "# HELP eventify_startup_seconds Time this worker spent starting up, by phase.",
+                "# TYPE eventify_startup_seconds gauge",
+                *(
+                    f"eventify_startup_seconds{_labels(phase=phase)} {_number(seconds)}"
+                    for phase, seconds in self.startup_seconds.items()
+                ),
+            ]
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+class MetricsMiddleware:
+    """Plain ASGI middleware recording latency, status and SQL work per route template."""
+
+    def __init__(self, app, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # If the app raises before responding
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        self.registry.in_flight += 1
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            seconds = time.perf_counter() - started_at
+            self.registry.in_flight -= 1
+            _request_stats.reset(token)
+            # The router stores the matched route in the scope; label by its template, not the raw path
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            self.registry.observe(scope["method"], route_path, status_code, seconds, stats)
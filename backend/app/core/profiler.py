@@ -0,0 +1,205 @@
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from app.core.config import settings
+from app.core.metrics import UNMATCHED_ROUTE
+
+# Placeholders of the supported drivers: ?, $1, %(name)s and :name
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_REPEATED_PARAMS = re.compile(r"\?(?:\s*,\s*\?)+")
+_REPEATED_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+
+# Statements that EXPLAIN can describe without running them
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """Statement shape: literals and placeholders become ?, expanded IN lists collapse to one."""
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _LITERAL.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    shape = _REPEATED_PARAMS.sub("?", shape)
+    return _REPEATED_ROWS.sub("(?)", shape)
+
+class RequestProfile:
+    """Statement shapes run by one request, to spot the same query repeated per row."""
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.shapes: Counter = Counter()
+
+    @property
+    def route(self) -> str:
+        return f"{self.scope['method']} {getattr(self.scope.get('route'), 'path', None) or UNMATCHED_ROUTE}"
+
+_request_profile: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+class QueryFinding:
+    """Slow executions and N+1 repeats of one normalized statement."""
+
+    def __init__(self, statement: str):
+        self.statement = statement
+        self.slow_count = 0
+        self.slow_total_ms = 0.0
+        self.slow_max_ms = 0.0
+        self.last_params: Optional[str] = None
+        self.plan: Optional[List[str]] = None
+        self.n_plus_one_count = 0  # Requests that repeated it past the threshold
+        self.max_per_request = 0
+        self.routes: set = set()
+
+    def as_dict(self) -> dict:
+        return {
+            "statement": self.statement,
+            "slow_count": self.slow_count,
+            "slow_total_ms": round(self.slow_total_ms, 3),
+            "slow_max_ms": round(self.slow_max_ms, 3),
+            "last_params": self.last_params,
+            "plan": self.plan,
+            "n_plus_one_count": self.n_plus_one_count,
+            "max_per_request": self.max_per_request,
+            "routes": sorted(self.routes),
+        }
+
+def explain(conn, statement: str, parameters) -> List[str]:
+    """The database's plan for a statement, run on the same connection without executing it."""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    if conn.dialect.name == "sqlite":
+        return [str(row[-1]) for row in rows]  # (id, parent, notused, detail)
+    return [str(row[0]) for row in rows]
+
+class QueryProfiler:
+    """Opt-in slow query log and N+1 detector attached to the engines' cursor events."""
+
+    def __init__(self, slow_ms: float, n_plus_one_threshold: int, max_findings: int):
+        self.slow_ms = slow_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.max_findings = max_findings
+        self.dropped = 0
+        self._findings: Dict[str, QueryFinding] = {}
+        self._lock = threading.Lock()
+
+    def _finding(self, shape: str) -> Optional[QueryFinding]:
+        # Called with the lock held; past max_findings new shapes are only counted
+        finding = self._findings.get(shape)
+        if finding is None:
+            if len(self._findings) >= self.max_findings:
+                self.dropped += 1
+                return None
+            finding = self._findings[shape] = QueryFinding(shape)
+        return finding
+
+    def instrument(self, sync_engine) -> None:
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info["profiler_started_at"] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info.pop("profiler_started_at", None)
+        if started_at is None:
+            return
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        profile = _request_profile.get()
+        if profile is None and elapsed_ms < self.slow_ms:
+            return
+
+        shape = normalize_statement(statement)
+        if profile is not None:
+            profile.shapes[shape] += 1
+        if elapsed_ms >= self.slow_ms:
+            streamed = context is not None and context.execution_options.get("stream_results", False)
+            self._record_slow(conn, statement, parameters, shape, elapsed_ms, profile, executemany or streamed)
+
+    def _record_slow(self, conn, statement, parameters, shape, elapsed_ms, profile, skip_explain) -> None:
+        route = profile.route if profile is not None else "background"
+        params = repr(parameters)[:500]
+        print(f"Slow query ({elapsed_ms:.1f} ms) in {route}: {shape} params={params}")
+
+        with self._lock:
+            finding = self._finding(shape)
+            if finding is None:
+                return
+            finding.slow_count += 1
+            finding.slow_total_ms += elapsed_ms
+            finding.slow_max_ms = max(finding.slow_max_ms, elapsed_ms)
+            finding.last_params = params
+            finding.routes.add(route)
+            needs_plan = finding.plan is None
+
+        # Explained once per shape; executemany and server-side cursors are skipped
+        if needs_plan and not skip_explain and statement.lstrip().upper().startswith(EXPLAINABLE):
+            try:
+                plan = explain(conn, statement, parameters)
+            except Exception as e:
+                plan = [f"EXPLAIN failed: {type(e).__name__}: {e}"]
+            for line in plan:
+                print(f"    {line}")
+            with self._lock:
+                finding.plan = plan
+
+    def finish_request(self, profile: RequestProfile) -> None:
+        repeated = [
+            (shape, count) for shape, count in profile.shapes.items()
+            if count > self.n_plus_one_threshold
+        ]
+        if not repeated:
+            return
+        route = profile.route
+        with self._lock:
+            for shape, count in repeated:
+                print(f"Possible N+1 in {route}: {count} x {shape}")
+                finding = self._finding(shape)
+                if finding is None:
+                    continue
+                finding.n_plus_one_count += 1
+                finding.max_per_request = max(finding.max_per_request, count)
+                finding.routes.add(route)
+
+    def findings(self) -> List[dict]:
+        """Findings with the most slow time first, then the most repeated."""
+        with self._lock:
+            findings = [finding.as_dict() for finding in self._findings.values()]
+        return sorted(findings, key=lambda f: (f["slow_total_ms"], f["max_per_request"]), reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._findings.clear()
+            self.dropped = 0
+
+query_profiler = QueryProfiler(
+    settings.SQL_SLOW_QUERY_MS, settings.SQL_N_PLUS_ONE_THRESHOLD, settings.SQL_PROFILER_MAX_FINDINGS
+)
+
+class ProfilerMiddleware:
+    """Collects the statement shapes of each HTTP request for N+1 detection."""
+
+    def __init__(self, app, profiler: QueryProfiler = query_profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        profile = RequestProfile(scope)
+        token = _request_profile.set(profile)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_profile.reset(token)
+            self.profiler.finish_request(profile)
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from sqlalchemy import tuple_
+from sqlmodel import select
+from app.core.config import settings
+from app.core.jobs import enqueue_jobs, job_handler, job_row, job_worker
+from app.core.mail import send_mail
+from app.db.database import async_session_maker
+from app.models.event import Event
+from app.models.rsvp import RSVP, RSVPStatus
+from app.models.user import User
+
+@job_handler("schedule_reminders")
+async def schedule_reminders(payload: dict) -> None:
+    """Queue one send_reminder job per GOING attendee of events starting within REMINDER_LEAD_HOURS.
+
+    Events are read in (date, id) batches along ix_event_is_active_date; dedupe keys make
+    repeated scans enqueue each reminder only once.
+    """
+    now = datetime.utcnow()
+    horizon = now + timedelta(hours=settings.REMINDER_LEAD_HOURS)
+    after = None
+    async with async_session_maker() as session:
+        while True:
+            statement = select(Event.id, Event.date).where(
+                Event.is_active == True, Event.date > now, Event.date <= horizon
+            )
+            if after is not None:
+                statement = statement.where(tuple_(Event.date, Event.id) > after)
+            events = (await session.exec(
+                statement.order_by(Event.date, Event.id).limit(settings.REMINDER_BATCH_SIZE)
+            )).all()
+            if not events:
+                break
+
+            attendees = await session.stream(
+                select(RSVP.event_id, RSVP.user_id)
+                .where(RSVP.event_id.in_([event.id for event in events]), RSVP.status == RSVPStatus.GOING)
+                .execution_options(yield_per=settings.BULK_BATCH_SIZE)
+            )
+            async for partition in attendees.partitions():
+                await enqueue_jobs(session, [
+                    job_row(
+                        "send_reminder", {"event_id": event_id, "user_id": user_id},
+                        dedupe_key=f"reminder:{event_id}:{user_id}"
+                    )
+                    for event_id, user_id in partition
+                ])
+            await session.commit()
+            after = (events[-1].date, events[-1].id)
+
+@job_handler("send_reminder")
+async def send_reminder(payload: dict) -> None:
+    """Email one attendee, re-checking that the event and their RSVP still stand."""
+    async with async_session_maker() as session:
+        statement = (
+            select(Event, User)
+            .join(RSVP, RSVP.event_id == Event.id)
+            .join(User, User.id == RSVP.user_id)
+            .where(
+                Event.id == payload["event_id"],
+                RSVP.user_id == payload["user_id"],
+                RSVP.status == RSVPStatus.GOING,
+                Event.is_active == True
+            )
+        )
+        row = (await session.exec(statement)).first()
+    if row is None:
+        return
+    event, user = row
+    if event.date <= datetime.utcnow():
+        return
+
+    starts_at = event.time or f"{event.date:%H:%M}"
+    await send_mail(
+        user.email,
+        f"Reminder: {event.title} is coming up",
+        f"Hi {user.full_name},\n\n"
+        f"This is a reminder that {event.title} starts on {event.date:%A, %B %d} at {starts_at} "
+        f"at {event.location}.\n\nSee you there!\nEventiFy"
+    )
+
+job_worker.every(settings.REMINDER_SCAN_INTERVAL_SECONDS, "schedule_reminders")
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import orjson
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Protocol
+from urllib.parse import urlencode
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Response headers that are replayed from a cached entry
+CACHED_HEADERS = ("X-Next-Cursor",)
+
+class CacheBackend(Protocol):
+    """Storage for cached responses; entries are dicts with etag, body and headers."""
+
+    def get(self, key: str) -> Optional[dict]: ...
+    def set(self, key: str, entry: dict) -> None: ...
+    def delete(self, key: str) -> None: ...
+    def delete_prefix(self, prefix: str) -> None: ...
+
+class MemoryBackend:
+    """Per-process LRU store. Other workers only see changes once their TTL expires."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize, ttl)
+
+    def get(self, key: str) -> Optional[dict]:
+        return self._cache.get(key)
+
+    def set(self, key: str, entry: dict) -> None:
+        self._cache.set(key, entry)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in self._cache.keys():
+            if key.startswith(prefix):
+                self._cache.delete(key)
+
+class SQLiteBackend:
+    """Store in a local SQLite file so all workers on a host share entries and invalidations.
+
+    Stands in for a networked store such as Redis; entries are evicted oldest-first.
+    """
+
+    def __init__(self, path: str, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=1000")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            "key TEXT PRIMARY KEY, entry TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_response_cache_stored_at ON response_cache (stored_at)"
+        )
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT entry FROM response_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, entry: dict) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, entry, stored_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(entry), now, now + self.ttl)
+            )
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                "SELECT key FROM response_cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,)
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix)
+            )
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+class ResponseCache:
+    """Caches serialized JSON responses and answers conditional requests with 304."""
+
+    def __init__(self, backend: Optional[CacheBackend]):
+        self.backend = backend
+
+    @staticmethod
+    def key(namespace: str, request: Request) -> str:
+        # Normalize the query string so parameter order does not split entries
+        query = urlencode(sorted(request.query_params.multi_items()))
+        return f"{namespace}:{request.url.path.rstrip('/')}?{query}"
+
+    def _respond(self, request: Request, entry: dict, status: str) -> Response:
+        headers = {"ETag": entry["etag"], "X-Cache": status, **entry["headers"]}
+        if _etag_matches(request.headers.get("if-none-match"), entry["etag"]):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=entry["body"], media_type="application/json", headers=headers
+        )
+
+    def lookup(self, namespace: str, request: Request) -> Optional[Response]:
+        """Return the cached response (or a 304) for this request, if any."""
+        if self.backend is None:
+            return None
+        entry = self.backend.get(self.key(namespace, request))
+        return self._respond(request, entry, "HIT") if entry else None
+
+    def store(self, namespace: str, request: Request, content: Any, response: Optional[Response] = None) -> Response:
+        """Serialize content once, cache it, and return it with a strong ETag."""
+        body = orjson.dumps(content, default=jsonable_encoder).decode()
+        headers: Dict[str, str] = {}
+        if response is not None:
+            headers = {
+                name: response.headers[name]
+                for name in CACHED_HEADERS if name in response.headers
+            }
+        entry = {
+            "etag": '"' + hashlib.sha256(body.encode()).hexdigest()[:32] + '"',
+            "body": body,
+            "headers": headers,
+        }
+        if self.backend is not None:
+            self.backend.set(self.key(namespace, request), entry)
+        return self._respond(request, entry, "MISS")
+
+    def invalidate(self, namespace: str) -> None:
+        """Drop every entry in a namespace."""
+        if self.backend is not None:
+            self.backend.delete_prefix(f"{namespace}:")
+
+def _make_backend() -> Optional[CacheBackend]:
+    if settings.RESPONSE_CACHE_BACKEND == "memory":
+        return MemoryBackend(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS)
+    if settings.RESPONSE_CACHE_BACKEND == "sqlite":
+        return SQLiteBackend(
+            settings.RESPONSE_CACHE_PATH,
+            settings.RESPONSE_CACHE_SIZE,
+            settings.RESPONSE_CACHE_TTL_SECONDS
+        )
+    return None
+
+response_cache = ResponseCache(_make_backend())
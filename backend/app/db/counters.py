@@ -0,0 +1,143 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple
+from sqlalchemy import func, or_, true, update
+from sqlmodel import Session, select
+from app.db.database import engine
+from app.models.comment import Comment
+from app.models.event import Event
+from app.models.rsvp import RSVP, RSVPStatus
+
+# Denormalized per-event counter for each counted RSVP status
+COUNTER_COLUMNS = {
+    RSVPStatus.GOING: "going_count",
+    RSVPStatus.INTERESTED: "interested_count",
+}
+
+def _counter_update(event_id: int, status: RSVPStatus, delta: int):
+    column = getattr(Event, COUNTER_COLUMNS[status])
+    statement = (
+        update(Event)
+        .where(Event.id == event_id)
+        .values({column: column + delta})
+        .execution_options(synchronize_session=False)
+    )
+    if delta > 0 and status == RSVPStatus.GOING:
+        # Capacity check and increment happen in one atomic statement
+        statement = statement.where(Event.going_count < Event.max_attendees)
+    elif delta < 0:
+        statement = statement.where(column > 0)
+    return statement
+
+async def adjust_event_counters(
+    session,
+    event_id: int,
+    old_status: Optional[RSVPStatus],
+    new_status: Optional[RSVPStatus]
+) -> bool:
+    """Move an RSVP between counters inside the caller's transaction.
+
+    Returns False, changing nothing, when a GOING RSVP would exceed capacity.
+    """
+    if old_status == new_status:
+        return True
+
+    if new_status in COUNTER_COLUMNS:
+        result = await session.exec(_counter_update(event_id, new_status, 1))
+        if result.rowcount == 0:
+            return False
+    if old_status in COUNTER_COLUMNS:
+        await session.exec(_counter_update(event_id, old_status, -1))
+    return True
+
+# Histogram column for each star rating
+RATING_COLUMNS = {star: f"rating_{star}_count" for star in range(1, 6)}
+
+def counted_rating(comment: Comment) -> Optional[int]:
+    """The rating a comment contributes to its event's aggregates, if any."""
+    return comment.rating if comment.is_approved else None
+
+def _rating_update(event_id: int, changes: Iterable[Tuple[int, int]]):
+    """UPDATE applying (rating, +1/-1) changes to an event's aggregates, or None if they cancel out."""
+    deltas = {"rating_count": 0, "rating_sum": 0}
+    for rating, sign in changes:
+        deltas["rating_count"] += sign
+        deltas["rating_sum"] += sign * rating
+        deltas[RATING_COLUMNS[rating]] = deltas.get(RATING_COLUMNS[rating], 0) + sign
+
+    columns = [(getattr(Event, name), delta) for name, delta in deltas.items() if delta]
+    if not columns:
+        return None
+    return (
+        update(Event)
+        .where(Event.id == event_id)
+        .values({column: column + delta for column, delta in columns})
+        .execution_options(synchronize_session=False)
+    )
+
+async def adjust_event_ratings(
+    session,
+    event_id: int,
+    old_rating: Optional[int],
+    new_rating: Optional[int]
+) -> None:
+    """Move a comment's counted rating between aggregates inside the caller's transaction."""
+    changes = [(rating, sign) for rating, sign in ((old_rating, -1), (new_rating, 1)) if rating is not None]
+    statement = _rating_update(event_id, changes) if old_rating != new_rating else None
+    if statement is not None:
+        await session.exec(statement)
+
+async def add_event_ratings(session, ratings: Iterable[Tuple[int, Optional[int]]]) -> Set[int]:
+    """Count newly approved (event_id, rating) pairs with one UPDATE per event; returns events changed."""
+    by_event: Dict[int, list] = defaultdict(list)
+    for event_id, rating in ratings:
+        if rating is not None:
+            by_event[event_id].append((rating, 1))
+    for event_id, changes in by_event.items():
+        await session.exec(_rating_update(event_id, changes))
+    return set(by_event)
+
+def _count_rsvps(*criteria):
+    return (
+        select(func.count(RSVP.id))
+        .where(RSVP.event_id == Event.id, *criteria)
+        .scalar_subquery()
+    )
+
+def _rated_comments(aggregate, *criteria):
+    return (
+        select(aggregate)
+        .where(
+            Comment.event_id == Event.id,
+            Comment.is_approved == true(),
+            Comment.rating.is_not(None),
+            *criteria
+        )
+        .scalar_subquery()
+    )
+
+def reconcile_event_counters(session: Session) -> int:
+    """Recompute every event's counters from the rsvp and comment tables; returns events corrected."""
+    expected = {
+        "going_count": _count_rsvps(RSVP.status == RSVPStatus.GOING),
+        "interested_count": _count_rsvps(RSVP.status == RSVPStatus.INTERESTED),
+        "checked_in_count": _count_rsvps(RSVP.checked_in == true()),
+        "rating_count": _rated_comments(func.count(Comment.id)),
+        "rating_sum": _rated_comments(func.coalesce(func.sum(Comment.rating), 0)),
+        **{
+            name: _rated_comments(func.count(Comment.id), Comment.rating == star)
+            for star, name in RATING_COLUMNS.items()
+        },
+    }
+    result = session.exec(
+        update(Event)
+        .where(or_(*[getattr(Event, name) != value for name, value in expected.items()]))
+        .values(expected)
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+    return result.rowcount
+
+if __name__ == "__main__":
+    with Session(engine) as session:
+        corrected = reconcile_event_counters(session)
+    print(f"Reconciled event counters: {corrected} event(s) corrected")
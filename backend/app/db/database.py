@@ -1,14 +1,178 @@
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+from sqlalchemy import event, func, inspect, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import create_engine, SQLModel, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.profiler import query_profiler
 
-engine = create_engine(settings.DATABASE_URL)
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+MIGRATIONS_DIR = ALEMBIC_INI.parent / "alembic" / "versions"
+_REVISION_LINE = re.compile(r"^(revision|down_revision)\s*(?::[^=]*)?=(.*)$", re.MULTILINE)
+
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+
+# pg_advisory_lock key held while one process upgrades the schema
+MIGRATION_LOCK_ID = 0x4576_6E74
+
+def engine_options() -> dict:
+    """Pool settings for the configured database; SQLite tuning is done with pragmas."""
+    if IS_SQLITE:
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def sqlite_pragmas() -> dict:
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in sqlite_pragmas().items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+# Sync engine for migrations, seeding and scripts
+engine = create_engine(settings.DATABASE_URL, **engine_options())
+
+# Async engine (aiosqlite / asyncpg) used by the API endpoints
+async_engine = create_async_engine(settings.async_database_url, **engine_options())
+
+if IS_SQLITE:
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+if settings.METRICS_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+
+if settings.SQL_PROFILER_ENABLED:
+    query_profiler.instrument(engine)
+    query_profiler.instrument(async_engine.sync_engine)
+
+async_session_maker = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
+def head_revision() -> Optional[str]:
+    """Latest migration revision, read from the scripts' revision lines without importing Alembic.
+
+    Returns None unless there is exactly one head, so callers fall back to a full upgrade.
+    """
+    revisions, parents = set(), set()
+    for path in MIGRATIONS_DIR.glob("*.py"):
+        for name, value in _REVISION_LINE.findall(path.read_text()):
+            ids = re.findall(r"[\"'](\w+)[\"']", value)
+            (revisions if name == "revision" else parents).update(ids)
+    heads = revisions - parents
+    return heads.pop() if len(heads) == 1 else None
+
+def current_revision() -> Optional[str]:
+    """Revision stamped in alembic_version, or None if the database was never migrated."""
+    with engine.connect() as connection:
+        if not inspect(connection).has_table("alembic_version"):
+            return None
+        return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+def _lock_file(handle, locked: bool) -> None:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+        handle.seek(0)
+        while True:
+            try:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK if locked else msvcrt.LK_UNLCK, 1)
+                return
+            except OSError:
+                if not locked:
+                    raise  # LK_LOCK gives up after ten seconds; keep waiting
+    else:
+        fcntl.flock(handle, fcntl.LOCK_EX if locked else fcntl.LOCK_UN)
+
+@contextmanager
+def migration_lock():
+    """Hold a cross-process lock so only one worker upgrades the schema at a time.
+
+    Uses a lock file beside a SQLite database and pg_advisory_lock on PostgreSQL.
+    """
+    if IS_SQLITE:
+        database = engine.url.database
+        if not database or database == ":memory:":
+            yield
+            return
+        with open(f"{database}.migrate.lock", "a+b") as handle:
+            _lock_file(handle, True)
+            try:
+                yield
+            finally:
+                _lock_file(handle, False)
+    elif engine.dialect.name == "postgresql":
+        with engine.connect() as connection:
+            connection.execute(select(func.pg_advisory_lock(MIGRATION_LOCK_ID)))
+            connection.commit()
+            try:
+                yield
+            finally:
+                connection.execute(select(func.pg_advisory_unlock(MIGRATION_LOCK_ID)))
+                connection.commit()
+    else:
+        yield
+
+def run_migrations():
+    """Upgrade the schema to the latest Alembic revision."""
+    # Imported here: Alembic is slow to import and warm starts do not need it
+    from alembic import command
+    from alembic.config import Config
+
+    alembic_cfg = Config(str(ALEMBIC_INI))
+    alembic_cfg.attributes["configure_logger"] = False
+
+    with engine.begin() as connection:
+        alembic_cfg.attributes["connection"] = connection
+        inspector = inspect(connection)
+        if inspector.has_table("user") and not inspector.has_table("alembic_version"):
+            # Database was created by create_all() before migrations existed
+            command.stamp(alembic_cfg, "0001")
+        command.upgrade(alembic_cfg, "head")
+
+def log_engine_settings():
+    """Print the settings the database actually applied, as a startup check."""
+    if IS_SQLITE:
+        with engine.connect() as connection:
+            effective = {
+                name: connection.execute(text(f"PRAGMA {name}")).scalar()
+                for name in sqlite_pragmas()
+            }
+        print(f"SQLite engine settings: {effective}")
+        if str(effective["journal_mode"]).lower() != settings.SQLITE_JOURNAL_MODE.lower():
+            print(f"Warning: requested journal_mode={settings.SQLITE_JOURNAL_MODE} was not applied")
+    else:
+        print(f"{engine.dialect.name} pool settings: {engine_options()}")
+
 def get_session():
     with Session(engine) as session:
         try:
             yield session
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+
+async def get_async_session():
+    async with async_session_maker() as session:
+        yield session
\ No newline at end of file
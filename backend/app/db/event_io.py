@@ -0,0 +1,233 @@
+import argparse
+import csv
+import io
+import json
+import sys
+from datetime import datetime
+from enum import Enum
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import Session, select
+from app.core.config import settings
+from app.db.database import engine
+from app.db.search import index_new_events
+from app.models.event import Event, EventCreate
+from app.models.rsvp import RSVP, RSVPStatus
+from app.models.user import User
+
+FORMATS = ("csv", "ndjson")
+
+# Columns written by exports; the EventCreate fields round-trip through import
+EXPORT_FIELDS = ["id", *EventCreate.model_fields, "organizer_id", "going_count", "interested_count", "created_at"]
+
+ATTENDEE_RSVP_FIELDS = ["id", "user_id", "status", "notes", "checked_in", "checked_in_at", "created_at", "updated_at"]
+ATTENDEE_EXPORT_FIELDS = [*ATTENDEE_RSVP_FIELDS, "email", "full_name"]
+
+def guess_format(filename: Optional[str]) -> str:
+    if filename and filename.lower().endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return "csv"
+
+def read_records(file: IO[str], fmt: str) -> Iterator[Tuple[int, object]]:
+    """Yield (line number, record dict) pairs, or (line number, error message) for unparsable lines."""
+    if fmt == "csv":
+        reader = csv.DictReader(file)
+        for record in reader:
+            # Empty cells fall back to the field defaults; unknown columns are ignored
+            yield reader.line_num, {k: v for k, v in record.items() if k and v not in ("", None)}
+        return
+
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, f"Invalid JSON: {e}"
+            continue
+        yield line_number, record if isinstance(record, dict) else "Expected a JSON object"
+
+def batched(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+class ImportReport:
+    """Counts rows and keeps the first IMPORT_MAX_ERRORS per-row errors."""
+
+    def __init__(self, organizer_id: int):
+        self.organizer_id = organizer_id
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+
+    def error(self, line: Optional[int], message) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append({"line": line, "errors": message})
+
+    def validate(self, batch: list) -> Tuple[List[int], List[dict]]:
+        """Turn a batch of read_records() output into insertable rows and their line numbers."""
+        now = datetime.utcnow()
+        lines, rows = [], []
+        for line, record in batch:
+            if isinstance(record, str):
+                self.error(line, record)
+                continue
+            try:
+                event = EventCreate.model_validate(record)
+            except ValidationError as e:
+                self.error(line, [
+                    {"field": ".".join(str(part) for part in err["loc"]), "message": err["msg"]}
+                    for err in e.errors()
+                ])
+                continue
+            lines.append(line)
+            rows.append({
+                **event.model_dump(),
+                "organizer_id": self.organizer_id,
+                "created_at": now,
+                "is_active": True,
+            })
+        return lines, rows
+
+    def as_dict(self) -> dict:
+        return {
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+def insert_events(session: Session, rows: List[dict]) -> List[int]:
+    """Insert a batch with one executemany, add it to the search index and return the new ids in order."""
+    table = Event.__table__
+    result = session.execute(
+        insert(table).returning(
+            table.c.id, table.c.title, table.c.description, table.c.is_active, sort_by_parameter_order=True
+        ),
+        rows
+    )
+    inserted = result.all()
+    index_new_events(session, [(row.id, row.title, row.description) for row in inserted if row.is_active])
+    return [row.id for row in inserted]
+
+def import_batch(session: Session, report: ImportReport, batch: list) -> None:
+    """Validate and insert one batch in its own transaction; a failed batch is reported per row."""
+    lines, rows = report.validate(batch)
+    if not rows:
+        return
+    try:
+        insert_events(session, rows)
+        session.commit()
+        report.inserted += len(rows)
+    except DBAPIError as e:
+        session.rollback()
+        for line in lines:
+            report.error(line, f"Database error: {e.orig}")
+
+def read_batches(file: IO[str], fmt: str, report: ImportReport) -> Iterator[list]:
+    """Batches of read_records() output; an undecodable file ends the import with an error."""
+    try:
+        yield from batched(read_records(file, fmt), settings.BULK_BATCH_SIZE)
+    except (UnicodeDecodeError, csv.Error) as e:
+        report.error(None, f"Unreadable file: {e}")
+
+def import_events(session: Session, file: IO[str], fmt: str, organizer_id: int) -> dict:
+    """Stream-import events from a CSV or NDJSON file owned by organizer_id."""
+    report = ImportReport(organizer_id)
+    for batch in read_batches(file, fmt, report):
+        import_batch(session, report, batch)
+    return report.as_dict()
+
+def export_statement(organizer_id: Optional[int] = None):
+    columns = Event.__table__.columns
+    statement = (
+        select(*[columns[name] for name in EXPORT_FIELDS])
+        .where(Event.is_active == True)
+        .order_by(Event.id)
+        .execution_options(yield_per=settings.BULK_BATCH_SIZE)
+    )
+    if organizer_id is not None:
+        statement = statement.where(Event.organizer_id == organizer_id)
+    return statement
+
+def attendee_export_statement(event_id: int, status: Optional[RSVPStatus] = None, checked_in: Optional[bool] = None):
+    """RSVPs of an event with their users, in (event_id, user_id) index order."""
+    statement = (
+        select(*[RSVP.__table__.columns[name] for name in ATTENDEE_RSVP_FIELDS], User.email, User.full_name)
+        .join(User, RSVP.user_id == User.id)
+        .where(RSVP.event_id == event_id)
+        .order_by(RSVP.user_id)
+        .execution_options(yield_per=settings.BULK_BATCH_SIZE)
+    )
+    if status is not None:
+        statement = statement.where(RSVP.status == status)
+    if checked_in is not None:
+        statement = statement.where(RSVP.checked_in == checked_in)
+    return statement
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+def format_rows(rows: list, fmt: str) -> str:
+    """Serialize a partition of export rows as NDJSON lines or CSV records."""
+    if fmt == "ndjson":
+        return "".join(orjson.dumps(row._asdict()).decode() + "\n" for row in rows)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+def csv_header(fields: List[str] = EXPORT_FIELDS) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(fields)
+    return buffer.getvalue()
+
+def export_events(session: Session, out: IO[str], fmt: str, organizer_id: Optional[int] = None) -> int:
+    """Stream active events to a file, one yield_per partition at a time."""
+    if fmt == "csv":
+        out.write(csv_header())
+    count = 0
+    for rows in session.execute(export_statement(organizer_id)).partitions():
+        out.write(format_rows(rows, fmt))
+        count += len(rows)
+    return count
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk import or export events as CSV or NDJSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="import events from a file ('-' for stdin)")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--organizer-id", type=int, required=True)
+    import_parser.add_argument("--format", choices=FORMATS)
+    export_parser = commands.add_parser("export", help="export active events to a file ('-' for stdout)")
+    export_parser.add_argument("path")
+    export_parser.add_argument("--organizer-id", type=int)
+    export_parser.add_argument("--format", choices=FORMATS)
+    args = parser.parse_args(argv)
+    fmt = args.format or guess_format(args.path)
+
+    with Session(engine) as session:
+        if args.command == "import":
+            file = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8-sig", newline="")
+            with file:
+                report = import_events(session, file, fmt, args.organizer_id)
+            print(json.dumps(report, indent=2))
+        else:
+            out = sys.stdout if args.path == "-" else open(args.path, "w", encoding="utf-8", newline="")
+            with out:
+                count = export_events(session, out, fmt, args.organizer_id)
+            print(f"Exported {count} event(s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+from sqlalchemy import insert
+from sqlmodel import Session, select
+from app.core.auth import pwd_context
+from app.core.config import settings
+from app.db.counters import reconcile_event_counters
+from app.db.database import engine, run_migrations
+from app.db.event_io import batched, insert_events
+from app.db.rsvps import UPSERT_DIALECTS
+from app.db.search import setup_search_index
+from app.models.comment import Comment
+from app.models.rsvp import RSVP, RSVPStatus
+from app.models.user import User, UserRole
+
+# Skewed like real traffic: a few categories hold most events
+CATEGORY_WEIGHTS = {
+    "tech": 30, "music": 22, "sports": 14, "food": 11,
+    "art": 8, "business": 7, "education": 5, "health": 3,
+}
+TOPICS = ["AI", "jazz", "startups", "street food", "yoga", "robotics", "indie rock", "design", "chess", "coffee"]
+KINDS = ["Meetup", "Festival", "Workshop", "Conference", "Concert", "Night", "Summit", "Expo", "Tour", "Market"]
+CITIES = ["Berlin", "Lagos", "Austin", "Pune", "Osaka", "Lima", "Oslo", "Cairo", "Toronto", "Seoul"]
+FIRST_NAMES = ["Ada", "Ravi", "Mei", "Omar", "Lena", "Kofi", "Sofia", "Yuki", "Diego", "Amara"]
+LAST_NAMES = ["Okafor", "Smith", "Tanaka", "Garcia", "Novak", "Khan", "Silva", "Berg", "Mensah", "Kim"]
+COMMENT_OPENERS = ["Loved the", "Great", "Well organized", "Crowded but fun", "Disappointing", "Memorable"]
+
+ORGANIZER_SHARE = 0.05
+RSVP_STATUS_WEIGHTS = {RSVPStatus.GOING: 55, RSVPStatus.INTERESTED: 35, RSVPStatus.NOT_GOING: 10}
+RATING_WEIGHTS = [1, 1, 2, 4, 5]  # 1..5 stars
+BCRYPT_SALT_CHARS = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+# Date treated as "now", fixed so a seed yields the same rows whenever it runs
+DEFAULT_ANCHOR = datetime(2026, 1, 1)
+
+def zipf_cum_weights(count: int, exponent: float) -> List[float]:
+    """Cumulative weights where the item at rank k is picked in proportion to 1 / k**exponent."""
+    total = 0.0
+    weights = []
+    for rank in range(1, count + 1):
+        total += rank ** -exponent
+        weights.append(total)
+    return weights
+
+def _timed(label: str, started_at: float, count: int) -> None:
+    elapsed = time.perf_counter() - started_at
+    print(f"Inserted {count} {label} in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f}/s)", file=sys.stderr)
+
+class Generator:
+    """Deterministic synthetic data: the same seed and anchor produce the same rows.
+
+    Rows are drawn from one random stream in a fixed order, so the batch size
+    only changes how they are written, not what they contain.
+    """
+
+    def __init__(self, session: Session, seed: int, anchor: datetime, years: float, batch_size: int):
+        self.session = session
+        self.rng = random.Random(seed)
+        self.anchor = anchor
+        # Two thirds of the span is history, the rest is upcoming events
+        self.start = anchor - timedelta(days=365 * years * 2 / 3)
+        self.span_hours = int(365 * years * 24)
+        self.history_minutes = int((anchor - self.start).total_seconds() // 60)
+        self.batch_size = batch_size
+        self.user_ids: List[int] = []
+        self.organizer_ids: List[int] = []
+        self.event_ids: List[int] = []
+        self.event_dates: List[datetime] = []
+        self.event_capacities: List[int] = []
+        self.event_popularity: List[float] = []
+
+    def _write(self, label: str, rows: Iterator[dict], write) -> int:
+        """Write rows in batched transactions; write() returns how many rows a batch stored."""
+        started_at = time.perf_counter()
+        count = 0
+        for batch in batched(rows, self.batch_size):
+            count += write(batch)
+            self.session.commit()
+        _timed(label, started_at, count)
+        return count
+
+    def users(self, count: int, password: str, email_prefix: str) -> int:
+        if self.session.exec(select(User.id).where(User.email == f"{email_prefix}0@example.com")).first():
+            raise ValueError(f"Users with the email prefix {email_prefix!r} already exist")
+        rng = self.rng
+        # One bcrypt hash for everyone (hashing per user would dominate the run), salted from the seed
+        salt = "".join(rng.choice(BCRYPT_SALT_CHARS) for _ in range(21)) + "."
+        hashed_password = pwd_context.handler("bcrypt").using(salt=salt).hash(password)
+
+        def rows():
+            for i in range(count):
+                role = UserRole.ADMIN if i == 0 else (
+                    UserRole.ORGANIZER if rng.random() < ORGANIZER_SHARE else UserRole.ATTENDEE
+                )
+                yield {
+                    "email": f"{email_prefix}{i}@example.com",
+                    "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                    "role": role,
+                    "is_active": rng.random() > 0.01,
+                    "hashed_password": hashed_password,
+                    "created_at": self.start + timedelta(minutes=rng.randrange(self.history_minutes)),
+                }
+
+        table = User.__table__
+        def write(batch):
+            result = self.session.execute(insert(table).returning(table.c.id, table.c.role, sort_by_parameter_order=True), batch)
+            inserted = result.all()
+            for user_id, role in inserted:
+                self.user_ids.append(user_id)
+                if role != UserRole.ATTENDEE:
+                    self.organizer_ids.append(user_id)
+            return len(inserted)
+
+        return self._write("users", rows(), write)
+
+    def events(self, count: int, expected_rsvps: int) -> int:
+        if not self.organizer_ids:
+            raise ValueError("Events need organizers; generate users first")
+        rng = self.rng
+        # A handful of organizers run most events
+        organizer_weights = zipf_cum_weights(len(self.organizer_ids), 1.0)
+        categories, category_weights = list(CATEGORY_WEIGHTS), list(CATEGORY_WEIGHTS.values())
+        # Popularity by rank; capacity grows with the RSVPs an event is expected to draw
+        self.event_popularity = zipf_cum_weights(count, 1.1)
+        total = self.event_popularity[-1]
+        going_share = RSVP_STATUS_WEIGHTS[RSVPStatus.GOING] / sum(RSVP_STATUS_WEIGHTS.values())
+
+        def rows():
+            for rank in range(1, count + 1):
+                expected_going = expected_rsvps * rank ** -1.1 / total * going_share
+                date = self.start + timedelta(hours=rng.randrange(self.span_hours))
+                date = date.replace(hour=rng.choice([10, 12, 17, 18, 19, 19, 20, 20, 21]), minute=0, second=0, microsecond=0)
+                topic, kind, city = rng.choice(TOPICS), rng.choice(KINDS), rng.choice(CITIES)
+                capacity = max(rng.choice([20, 50, 100, 200, 500]), math.ceil(expected_going * 1.2))
+                self.event_dates.append(date)
+                self.event_capacities.append(capacity)
+                yield {
+                    "title": f"{city} {topic.title()} {kind}",
+                    "description": f"A {kind.lower()} about {topic} in {city}.",
+                    "category": rng.choices(categories, weights=category_weights)[0],
+                    "date": date,
+                    "time": date.strftime("%H:%M"),
+                    "location": f"{rng.choice(['Hall', 'Park', 'Center', 'Arena', 'Loft'])} {rng.randint(1, 50)}, {city}",
+                    "max_attendees": capacity,
+                    "price": 0.0 if rng.random() < 0.4 else float(rng.choice([5, 10, 15, 25, 50, 100])),
+                    "organizer_id": rng.choices(self.organizer_ids, cum_weights=organizer_weights)[0],
+                    "created_at": min(date, self.anchor) - timedelta(days=rng.randint(7, 90)),
+                    "is_active": rng.random() > 0.03,
+                }
+
+        def write(batch):
+            event_ids = insert_events(self.session, batch)
+            self.event_ids.extend(event_ids)
+            return len(event_ids)
+
+        return self._write("events", rows(), write)
+
+    def _pick_event(self) -> int:
+        """Index of an event, favoring popular ones."""
+        return self.rng.choices(range(len(self.event_ids)), cum_weights=self.event_popularity)[0]
+
+    def rsvps(self, count: int) -> int:
+        """Draw count RSVPs; repeated (user, event) pairs are skipped, so fewer rows may be written."""
+        rng = self.rng
+        statuses, status_weights = list(RSVP_STATUS_WEIGHTS), list(RSVP_STATUS_WEIGHTS.values())
+        # GOING draws per event, including pairs later skipped as duplicates, so capacity always holds
+        going = [0] * len(self.event_ids)
+
+        def rows():
+            for _ in range(count):
+                index = self._pick_event()
+                date = self.event_dates[index]
+                status = rng.choices(statuses, weights=status_weights)[0]
+                if status == RSVPStatus.GOING:
+                    if going[index] >= self.event_capacities[index]:
+                        status = RSVPStatus.INTERESTED  # Full events turn extra attendees away, as the API does
+                    else:
+                        going[index] += 1
+                created_at = min(date, self.anchor) - timedelta(minutes=rng.randrange(60 * 24 * 60))
+                checked_in = status == RSVPStatus.GOING and date < self.anchor and rng.random() < 0.7
+                yield {
+                    "user_id": rng.choice(self.user_ids),
+                    "event_id": self.event_ids[index],
+                    "status": status,
+                    "notes": None,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "checked_in": checked_in,
+                    "checked_in_at": date + timedelta(minutes=rng.randrange(-30, 90)) if checked_in else None,
+                }
+
+        statement = UPSERT_DIALECTS[self.session.get_bind().dialect.name](RSVP.__table__).on_conflict_do_nothing(
+            index_elements=["user_id", "event_id"]
+        )
+        return self._write("rsvps", rows(), lambda batch: self.session.execute(statement, batch).rowcount)
+
+    def comments(self, count: int) -> int:
+        rng = self.rng
+
+        def rows():
+            for _ in range(count):
+                index = self._pick_event()
+                date = self.event_dates[index]
+                if date < self.anchor:
+                    created_at = min(self.anchor, date + timedelta(hours=rng.randrange(1, 24 * 14)))
+                else:
+                    created_at = self.anchor - timedelta(hours=rng.randrange(1, 24 * 14))
+                yield {
+                    "content": f"{rng.choice(COMMENT_OPENERS)} {rng.choice(TOPICS)} {rng.choice(KINDS).lower()}!",
+                    "rating": rng.choices(range(1, 6), weights=RATING_WEIGHTS)[0] if rng.random() < 0.8 else None,
+                    "user_id": rng.choice(self.user_ids),
+                    "event_id": self.event_ids[index],
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "is_approved": rng.random() < 0.92,
+                }
+
+        statement = insert(Comment.__table__)
+        return self._write("comments", rows(), lambda batch: self.session.execute(statement, batch).rowcount)
+
+def generate(session: Session, users: int, events: int, rsvps: int, comments: int, seed: int = 42,
+             password: str = "password123", email_prefix: str = "user", anchor: datetime = DEFAULT_ANCHOR,
+             years: float = 3, batch_size: Optional[int] = None) -> dict:
+    """Insert synthetic users, events, RSVPs and comments, then rebuild the event counters."""
+    generator = Generator(session, seed, anchor, years, batch_size or settings.BULK_BATCH_SIZE)
+    summary = {
+        "users": generator.users(users, password, email_prefix),
+        "events": generator.events(events, rsvps) if events else 0,
+    }
+    summary["rsvps"] = generator.rsvps(rsvps) if events and rsvps else 0
+    summary["comments"] = generator.comments(comments) if events and comments else 0
+
+    # Counters and rating aggregates are derived data; compute them once at the end
+    started_at = time.perf_counter()
+    summary["events_reconciled"] = reconcile_event_counters(session)
+    print(f"Reconciled event counters in {time.perf_counter() - started_at:.1f}s", file=sys.stderr)
+    return summary
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Generate deterministic synthetic users, events, RSVPs and comments")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=2_000)
+    parser.add_argument("--rsvps", type=int, default=100_000, help="RSVPs to draw (duplicate pairs are skipped)")
+    parser.add_argument("--comments", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--anchor", type=datetime.fromisoformat, default=DEFAULT_ANCHOR,
+        help=f"date treated as 'now' (default: {DEFAULT_ANCHOR.date()})"
+    )
+    parser.add_argument("--years", type=float, default=3, help="span of event dates, two thirds in the past")
+    parser.add_argument("--password", default="password123", help="password shared by every generated user")
+    parser.add_argument("--email-prefix", default="user", help="emails are <prefix><n>@example.com")
+    parser.add_argument("--batch-size", type=int, default=5000, help="rows per INSERT and transaction")
+    args = parser.parse_args(argv)
+
+    run_migrations()
+    setup_search_index(engine)
+    with Session(engine) as session:
+        try:
+            summary = generate(
+                session, args.users, args.events, args.rsvps, args.comments, seed=args.seed,
+                password=args.password, email_prefix=args.email_prefix, anchor=args.anchor,
+                years=args.years, batch_size=args.batch_size
+            )
+        except ValueError as e:
+            raise SystemExit(str(e))
+    print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    main()
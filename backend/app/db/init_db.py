@@ -1,22 +1,60 @@
+import time
+from typing import Optional
 from sqlmodel import Session, select
 from datetime import datetime, timedelta
-from app.db.database import engine, create_db_and_tables
+from app.core.config import settings
+from app.db.counters import reconcile_event_counters
+from app.db.database import (
+    current_revision, engine, head_revision, log_engine_settings, migration_lock, run_migrations
+)
+from app.db.search import index_event, setup_search_index
 from app.models.user import User, UserRole
 from app.models.event import Event
 from app.models.rsvp import RSVP, RSVPStatus
 from app.core.auth import get_password_hash
 
-def init_db():
-    """Initialize database with tables and seed data."""
-    # Create all tables
-    create_db_and_tables()
-    
+def _timed(timings: dict, name: str, func, *args):
+    started_at = time.perf_counter()
+    result = func(*args)
+    timings[name] = time.perf_counter() - started_at
+    return result
+
+def migrate_if_behind(head: Optional[str]) -> None:
+    """Upgrade under the migration lock, unless another worker got there while we waited."""
+    with migration_lock():
+        current = current_revision()
+        if head is not None and current == head:
+            return
+        print(f"Schema at revision {current or 'none'}, migrating to {head or 'head'}")
+        run_migrations()
+
+def init_db() -> dict:
+    """Prepare the database on API startup; returns the seconds spent per phase.
+
+    With STARTUP_MIGRATIONS=auto the Alembic upgrade only runs when the stored
+    schema version is behind the migration scripts, so warm boots skip it.
+    Workers starting together on a cold database take turns; the first upgrades.
+    """
+    timings = {}
+    _timed(timings, "engine_settings", log_engine_settings)
+    if settings.STARTUP_MIGRATIONS == "always":
+        _timed(timings, "migrations", migrate_if_behind, None)
+    elif settings.STARTUP_MIGRATIONS == "auto":
+        current, head = _timed(timings, "schema_check", lambda: (current_revision(), head_revision()))
+        if current != head:
+            _timed(timings, "migrations", migrate_if_behind, head)
+    _timed(timings, "search_index", setup_search_index, engine)
+    if settings.SEED_ON_STARTUP:
+        _timed(timings, "seed", seed_db)
+    return timings
+
+def seed_db() -> bool:
+    """Add demo users, events and RSVPs to an empty database; returns False if it already has users."""
     with Session(engine) as session:
         # Check if we already have users (avoid duplicate seeding)
-        existing_users = session.exec(select(User)).first()
-        if existing_users:
+        if session.exec(select(User.id)).first() is not None:
             print("Database already seeded, skipping...")
-            return
+            return False
         
         # Create sample users
         users_data = [
@@ -53,13 +91,15 @@ def init_db():
         ]
         
         created_users = []
+        hashes = {}  # bcrypt is slow; hash each distinct demo password once
         for user_data in users_data:
             password = user_data.pop("password")
-            hashed_password = get_password_hash(password)
+            if password not in hashes:
+                hashes[password] = get_password_hash(password)
             
             user = User(
                 **user_data,
-                hashed_password=hashed_password
+                hashed_password=hashes[password]
             )
             session.add(user)
             created_users.append(user)
@@ -77,6 +117,7 @@ def init_db():
             {
                 "title": "Sarah & Mike's Wedding Celebration",
                 "description": "Join us for a beautiful wedding ceremony and reception. Dress code: Semi-formal. Dinner and dancing to follow the ceremony.",
+                "category": "entertainment",
                 "date": base_date + timedelta(days=14),  # 3 weeks from now
                 "location": "Grand Ballroom, Marriott Hotel, Downtown",
                 "max_attendees": 150,
@@ -86,6 +127,7 @@ def init_db():
             {
                 "title": "Baby Shower for Emma & David",
                 "description": "Celebrating the upcoming arrival of baby Johnson! Games, gifts, and refreshments. Please RSVP with dietary restrictions.",
+                "category": "entertainment",
                 "date": base_date + timedelta(days=21),  # 4 weeks from now
                 "location": "Community Center, 123 Oak Street",
                 "max_attendees": 50,
@@ -95,6 +137,7 @@ def init_db():
             {
                 "title": "Golden Anniversary - 50 Years Together",
                 "description": "Celebrating Robert & Mary's 50th wedding anniversary! Join us for an afternoon of memories, music, and cake.",
+                "category": "entertainment",
                 "date": base_date + timedelta(days=28),  # 5 weeks from now
                 "location": "Sunset Gardens Event Hall",
                 "max_attendees": 100,
@@ -104,6 +147,7 @@ def init_db():
             {
                 "title": "Tech Meetup: AI in 2024",
                 "description": "Monthly tech meetup discussing the latest trends in AI and machine learning. Networking and pizza included!",
+                "category": "tech",
                 "date": base_date + timedelta(days=10),  # 2.5 weeks from now
                 "location": "Innovation Hub, Tech District",
                 "max_attendees": 80,
@@ -113,6 +157,7 @@ def init_db():
             {
                 "title": "Summer Music Festival",
                 "description": "Outdoor music festival featuring local bands and food trucks. Bring your own chairs and enjoy the music!",
+                "category": "music",
                 "date": base_date + timedelta(days=35),  # 6 weeks from now
                 "location": "Central Park Amphitheater",
                 "max_attendees": 500,
@@ -132,6 +177,7 @@ def init_db():
         # Refresh events to get their IDs
         for event in created_events:
             session.refresh(event)
+            index_event(session, event)
         
         # Create some sample RSVPs
         rsvps_data = [
@@ -153,6 +199,7 @@ def init_db():
             session.add(rsvp)
         
         session.commit()
+        reconcile_event_counters(session)
         
         print("Database initialized successfully!")
         print("\nSample users created:")
@@ -163,6 +210,10 @@ def init_db():
         print("- jane@example.com (password: attendee123) - Attendee")
         print(f"\n{len(created_events)} sample events created with future dates")
         print(f"{len(rsvps_data)} sample RSVPs created")
+        return True
 
 if __name__ == "__main__":
-    init_db()
+    # Explicit setup for new databases: python -m app.db.init_db
+    run_migrations()
+    setup_search_index(engine)
+    seed_db()
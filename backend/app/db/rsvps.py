@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import literal, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import select
+from app.models.event import Event
+from app.models.rsvp import RSVP, RSVPStatus
+
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE ... RETURNING
+UPSERT_DIALECTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+def upsert_rsvp_statement(dialect: str, user_id: int, event_id: int, status: RSVPStatus, notes: Optional[str]):
+    """Build the single-statement RSVP write for a user and event.
+
+    Inserts from a SELECT on the event so a missing or inactive event inserts
+    nothing and returns no row. On conflict the existing row is updated, and
+    previous_status captures its old status (SET expressions read the old row).
+    """
+    rsvp = RSVP.__table__
+    columns = rsvp.c
+    now = datetime.utcnow()
+    source = select(
+        literal(user_id, columns.user_id.type),
+        Event.id,
+        literal(status, columns.status.type),
+        literal(notes, columns.notes.type),
+        literal(now, columns.created_at.type),
+        literal(now, columns.updated_at.type),
+        literal(False, columns.checked_in.type),
+    ).where(Event.id == event_id, Event.is_active == true())
+
+    insert = UPSERT_DIALECTS[dialect](rsvp).from_select(
+        ["user_id", "event_id", "status", "notes", "created_at", "updated_at", "checked_in"],
+        source
+    )
+    return insert.on_conflict_do_update(
+        index_elements=[columns.user_id, columns.event_id],
+        set_={
+            "previous_status": columns.status,
+            "status": insert.excluded.status,
+            "notes": insert.excluded.notes,
+            "updated_at": insert.excluded.updated_at,
+        }
+    ).returning(*columns)
@@ -0,0 +1,115 @@
+import re
+from sqlalchemy import Float, Integer, func, literal_column, text
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import Session
+from app.models.event import Event
+
+# Set by setup_search_index() once the text index is known to exist
+search_index_available = False
+
+# Must match the indexed expression exactly for Postgres to use the GIN index
+PG_SEARCH_VECTOR = (
+    "to_tsvector('english', coalesce(event.title, '') || ' ' || "
+    "coalesce(event.description, ''))"
+)
+
+def _search_terms(search: str) -> list:
+    return re.findall(r"\w+", search)
+
+def setup_search_index(engine) -> bool:
+    """Create the full-text index for events (FTS5 on SQLite, GIN on Postgres)."""
+    global search_index_available
+
+    dialect = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            if dialect == "sqlite":
+                exists = conn.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'event_fts'"
+                )).first()
+                if not exists:
+                    conn.execute(text(
+                        "CREATE VIRTUAL TABLE event_fts USING fts5(title, description)"
+                    ))
+                    conn.execute(text(
+                        "INSERT INTO event_fts(rowid, title, description) "
+                        "SELECT id, title, description FROM event WHERE is_active = 1"
+                    ))
+            elif dialect == "postgresql":
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_event_search ON event USING GIN ({PG_SEARCH_VECTOR})"
+                ))
+            else:
+                search_index_available = False
+                return False
+    except DBAPIError as e:
+        print(f"Full-text search index unavailable, using LIKE search: {e}")
+        search_index_available = False
+        return False
+
+    search_index_available = True
+    return True
+
+def index_event(session: Session, event: Event) -> None:
+    """Add or refresh an event in the search index (same transaction as the write)."""
+    if not search_index_available or session.get_bind().dialect.name != "sqlite":
+        return  # Postgres keeps its expression index in sync by itself
+
+    session.execute(
+        text("DELETE FROM event_fts WHERE rowid = :id"), {"id": event.id}
+    )
+    if event.is_active:
+        session.execute(
+            text("INSERT INTO event_fts(rowid, title, description) VALUES (:id, :title, :description)"),
+            {"id": event.id, "title": event.title, "description": event.description}
+        )
+
+def index_new_events(session: Session, rows: list) -> None:
+    """Index freshly inserted active events given as (id, title, description) rows."""
+    if not rows or not search_index_available or session.get_bind().dialect.name != "sqlite":
+        return
+
+    session.execute(
+        text("INSERT INTO event_fts(rowid, title, description) VALUES (:id, :title, :description)"),
+        [{"id": id, "title": title, "description": description} for id, title, description in rows]
+    )
+
+def remove_event(session: Session, event_id: int) -> None:
+    """Drop an event from the search index."""
+    if not search_index_available or session.get_bind().dialect.name != "sqlite":
+        return
+
+    session.execute(text("DELETE FROM event_fts WHERE rowid = :id"), {"id": event_id})
+
+def apply_search(statement, search: str, dialect: str, ranked: bool = True):
+    """Filter and, if ranked, order an event query by relevance.
+
+    Falls back to the LIKE filter when the text index is unavailable.
+    """
+    terms = _search_terms(search)
+    if not search_index_available or not terms:
+        return statement.where(
+            Event.title.contains(search) | Event.description.contains(search)
+        )
+
+    if dialect == "sqlite":
+        # Prefix match every term so search-as-you-type works
+        query = " ".join(f'"{term}"*' for term in terms)
+        matches = (
+            text(
+                "SELECT rowid AS event_id, bm25(event_fts) AS rank "
+                "FROM event_fts WHERE event_fts MATCH :search_query"
+            )
+            .bindparams(search_query=query)
+            .columns(event_id=Integer, rank=Float)
+            .subquery("event_search")
+        )
+        statement = statement.join(matches, matches.c.event_id == Event.id)
+        # bm25() is lower for better matches
+        return statement.order_by(matches.c.rank) if ranked else statement
+
+    query = " & ".join(f"{term}:*" for term in terms)
+    vector = literal_column(PG_SEARCH_VECTOR)
+    tsquery = func.to_tsquery("english", query)
+    statement = statement.where(vector.op("@@")(tsquery))
+    return statement.order_by(func.ts_rank(vector, tsquery).desc()) if ranked else statement
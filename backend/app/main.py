@@ -1,18 +1,45 @@
+import time
+STARTED_AT = time.perf_counter()  # Before the imports below, so their cost counts toward startup
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.api_v1.api import api_router
 from app.core.config import settings
+from app.core.jobs import job_worker
+from app.core.live import live_hub
+from app.core.metrics import MetricsMiddleware, metrics
+from app.core.profiler import ProfilerMiddleware
+from app.core import reminders  # noqa: F401 - registers the reminder jobs
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.db.init_db import init_db
 
+IMPORT_SECONDS = time.perf_counter() - STARTED_AT
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
-# Initialize database on startup
+# Migrate if the schema is behind, and report how long startup took
 @app.on_event("startup")
 def startup_event():
-    init_db()
+    phases = {"imports": IMPORT_SECONDS, **init_db()}
+    phases["total"] = time.perf_counter() - STARTED_AT
+    print("Startup took " + ", ".join(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in phases.items()))
+    metrics.record_startup(phases)
+
+# Process queued background jobs (reminders) in this worker
+@app.on_event("startup")
+async def start_job_worker():
+    if settings.JOB_WORKER_ENABLED:
+        job_worker.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await live_hub.stop()
+    await job_worker.stop()
 
 # Set all CORS enabled origins
 app.add_middleware(
@@ -28,10 +55,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+if settings.SQL_PROFILER_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
+
+# Added last so it is outermost and times the whole request
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 @app.get("/")
 def read_root():
-    return {"message": "Welcome to EventiFy API"}
\ No newline at end of file
+    return {"message": "Welcome to EventiFy API"}
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("Metrics are disabled", status_code=404)
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
\ No newline at end of file
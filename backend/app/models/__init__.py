@@ -1,11 +1,15 @@
 from .user import User, UserCreate, UserUpdate, UserRole
-from .event import Event, EventCreate, EventUpdate
+from .event import Event, EventCard, EventCreate, EventFields, EventUpdate
 from .rsvp import RSVP, RSVPCreate, RSVPUpdate, RSVPResponse, RSVPStatus
-from .comment import Comment, CommentCreate, CommentUpdate, CommentResponse
+from .comment import Comment, CommentCreate, CommentUpdate, CommentResponse, CommentModeration
+from .job import Job, JobStatus
+from .checkin import CheckInScan, CheckInBatch, CheckInResult, CheckInBatchResponse, CheckInCode
 
 __all__ = [
     "User", "UserCreate", "UserUpdate", "UserRole",
-    "Event", "EventCreate", "EventUpdate",
+    "Event", "EventCard", "EventCreate", "EventFields", "EventUpdate",
     "RSVP", "RSVPCreate", "RSVPUpdate", "RSVPResponse", "RSVPStatus",
-    "Comment", "CommentCreate", "CommentUpdate", "CommentResponse"
+    "Comment", "CommentCreate", "CommentUpdate", "CommentResponse", "CommentModeration",
+    "CheckInScan", "CheckInBatch", "CheckInResult", "CheckInBatchResponse", "CheckInCode",
+    "Job", "JobStatus"
 ]
\ No newline at end of file
@@ -0,0 +1,29 @@
+from sqlmodel import SQLModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+class CheckInScan(SQLModel):
+    code: str
+    scanned_at: Optional[datetime] = None  # Set by scanners that queued the scan offline
+
+class CheckInBatch(SQLModel):
+    scans: List[CheckInScan] = Field(min_length=1)
+
+class CheckInResult(SQLModel):
+    code: str
+    # checked_in, already_checked_in, duplicate, invalid, wrong_event, not_found or not_going
+    result: str
+    rsvp_id: Optional[int] = None
+    user_id: Optional[int] = None
+    checked_in_at: Optional[datetime] = None
+
+class CheckInBatchResponse(SQLModel):
+    event_id: int
+    checked_in: int  # Newly checked in by this batch
+    checked_in_count: int
+    results: List[CheckInResult]
+
+class CheckInCode(SQLModel):
+    event_id: int
+    rsvp_id: int
+    code: str
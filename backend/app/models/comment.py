@@ -1,5 +1,6 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class CommentBase(SQLModel):
@@ -7,6 +8,13 @@ class CommentBase(SQLModel):
     rating: Optional[int] = Field(default=None, ge=1, le=5)  # 1-5 star rating
 
 class Comment(CommentBase, table=True):
+    __table_args__ = (
+        # Per-event approved comments, paged by (created_at, id)
+        Index("ix_comment_event_id_is_approved", "event_id", "is_approved", "created_at", "id"),
+        # Moderation queue (pending comments), paged by (created_at, id)
+        Index("ix_comment_is_approved_created_at", "is_approved", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")
     event_id: int = Field(foreign_key="event.id")
@@ -30,3 +38,11 @@ class CommentResponse(CommentBase):
     is_approved: bool
     # Include user info in response
     user_name: Optional[str] = None
+
+class CommentModeration(SQLModel):
+    """Selects pending comments by ID list and/or filter; all given criteria must match."""
+    ids: Optional[List[int]] = None
+    event_id: Optional[int] = None
+    user_id: Optional[int] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
@@ -1,3 +1,5 @@
+from pydantic import create_model
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 from typing import Optional
 from datetime import datetime
@@ -13,15 +15,60 @@ class EventBase(SQLModel):
     price: float = 0.0
 
 class Event(EventBase, table=True):
+    __table_args__ = (
+        # Listing filters on is_active and pages by (date, id)
+        Index("ix_event_is_active_date", "is_active", "date", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    organizer_id: int = Field(foreign_key="user.id")
+    organizer_id: int = Field(foreign_key="user.id", index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = True
     time: Optional[str] = "18:00"  # Default to 6:00 PM
+    # Maintained by RSVP writes (see app.db.counters)
+    going_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    interested_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # Maintained by door check-ins (see app.api.api_v1.endpoints.checkin)
+    checked_in_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # Approved comment ratings, maintained by comment writes (see app.db.counters)
+    rating_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_sum: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_1_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_2_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_3_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_4_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_5_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
 class EventCreate(EventBase):
     pass
 
+# Cards only show the start of the description (line-clamp-2 in EventCard.jsx)
+CARD_DESCRIPTION_LENGTH = 200
+
+class EventCard(SQLModel):
+    """Compact list representation with only the fields an event card renders."""
+    id: int
+    title: str
+    description: str  # Truncated to CARD_DESCRIPTION_LENGTH characters
+    date: datetime
+    time: Optional[str] = None
+    location: str
+    max_attendees: int
+    going_count: int = 0
+    interested_count: int = 0
+    rating_count: int = 0
+    rating_sum: int = 0  # Average is rating_sum / rating_count
+
+# A fields= projection: id and date (the page key) plus whichever event columns were requested
+EventFields = create_model(
+    "EventFields",
+    __base__=SQLModel,
+    **{
+        name: (field.annotation, ...) if name in ("id", "date") else (Optional[field.annotation], None)
+        for name, field in Event.model_fields.items()
+    }
+)
+
 class EventUpdate(SQLModel):
     title: Optional[str] = None
     description: Optional[str] = None
@@ -0,0 +1,32 @@
+from sqlalchemy import JSON, Column, Index
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+class Job(SQLModel, table=True):
+    __table_args__ = (
+        # Workers claim due jobs in (run_at, id) order
+        Index("ix_job_status_run_at", "status", "run_at", "id"),
+        # Makes fan-out idempotent, e.g. one reminder per event and attendee
+        Index("ix_job_dedupe_key", "dedupe_key", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str
+    payload: dict = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    max_attempts: int = 5
+    run_at: datetime = Field(default_factory=datetime.utcnow)
+    locked_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    dedupe_key: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
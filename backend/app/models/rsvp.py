@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 from typing import Optional
 from datetime import datetime
@@ -13,6 +14,12 @@ class RSVPBase(SQLModel):
     notes: Optional[str] = None
 
 class RSVP(RSVPBase, table=True):
+    __table_args__ = (
+        # One RSVP per user and event; also serves "my RSVPs" lookups
+        Index("ix_rsvp_user_id_event_id", "user_id", "event_id", unique=True),
+        Index("ix_rsvp_event_id_user_id", "event_id", "user_id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")
     event_id: int = Field(foreign_key="event.id")
@@ -20,6 +27,8 @@ class RSVP(RSVPBase, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     checked_in: bool = False
     checked_in_at: Optional[datetime] = None
+    # Status before the last upsert, so counters can be moved without a read
+    previous_status: Optional[RSVPStatus] = None
 
 class RSVPCreate(RSVPBase):
     pass  # event_id comes from URL path parameter
@@ -0,0 +1,341 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Seeded users all share this password (hashed once)
+PASSWORD = "benchmark123"
+# Vocabulary of app.db.generate, so filters and searches hit real rows
+CATEGORIES = ["tech", "music", "sports", "food", "art", "business", "education", "health"]
+WORDS = ["meetup", "festival", "workshop", "conference", "concert", "jazz", "startups", "yoga", "robotics", "design"]
+HOT_EVENTS = 10  # RSVP bursts target the first events, like a popular launch
+# Report fields that must match a baseline for the comparison to be like-for-like
+DATASET_FIELDS = ("seed", "anchor", "users", "events", "rsvps", "comments")
+
+Request = Tuple[str, str, dict]
+
+class Context:
+    """Seeded ids and pre-issued tokens the scenarios draw from."""
+
+    def __init__(self, user_ids: List[int], event_ids: List[int], tokens: List[str]):
+        self.user_ids = user_ids
+        self.event_ids = event_ids
+        self.tokens = tokens
+
+    def auth(self, rng: random.Random) -> dict:
+        return {"Authorization": f"Bearer {rng.choice(self.tokens)}"}
+
+def browse(ctx: Context, rng: random.Random) -> Request:
+    roll = rng.random()
+    if roll < 0.5:
+        return "GET", "/api/v1/events/", {"params": {"skip": rng.randrange(0, 100, 20), "limit": 20, "view": "card"}}
+    if roll < 0.7:
+        return "GET", "/api/v1/events/", {"params": {"category": rng.choice(CATEGORIES), "limit": 20}}
+    return "GET", f"/api/v1/events/{rng.choice(ctx.event_ids)}", {}
+
+def search(ctx: Context, rng: random.Random) -> Request:
+    return "GET", "/api/v1/events/", {"params": {"search": rng.choice(WORDS), "limit": 20}}
+
+def rsvp(ctx: Context, rng: random.Random) -> Request:
+    event_id = rng.choice(ctx.event_ids[:HOT_EVENTS])
+    status = rng.choices(["going", "interested", "not_going"], weights=[5, 3, 2])[0]
+    return "POST", f"/api/v1/events/{event_id}/rsvp", {"json": {"status": status}, "headers": ctx.auth(rng)}
+
+def login(ctx: Context, rng: random.Random) -> Request:
+    email = f"bench{rng.randrange(len(ctx.user_ids))}@example.com"
+    return "POST", "/api/v1/auth/login", {"data": {"username": email, "password": PASSWORD}}
+
+def comment(ctx: Context, rng: random.Random) -> Request:
+    event_id = rng.choice(ctx.event_ids)
+    body = {"event_id": event_id, "content": f"Loved the {rng.choice(WORDS)}!", "rating": rng.randint(1, 5)}
+    return "POST", f"/api/v1/events/{event_id}/comments", {"json": body, "headers": ctx.auth(rng)}
+
+def mixed(ctx: Context, rng: random.Random) -> Request:
+    scenario = rng.choices([browse, search, rsvp, comment, login], weights=[60, 15, 15, 5, 5])[0]
+    return scenario(ctx, rng)
+
+SCENARIOS: Dict[str, Callable[[Context, random.Random], Request]] = {
+    "browse": browse,
+    "search": search,
+    "rsvp": rsvp,
+    "login": login,
+    "comment": comment,
+    "mixed": mixed,
+}
+
+def seed_database(users: int, events: int, rsvps: int, comments: int, seed: int, anchor: datetime,
+                  token_count: int) -> Context:
+    """Generate benchmark data with app.db.generate, or reuse it if the database already has it.
+
+    Must run after DATABASE_URL is set, since app settings are read on import.
+    """
+    from sqlmodel import Session, select
+    from app.core.auth import create_access_token
+    from app.db.database import engine, run_migrations
+    from app.db.generate import generate
+    from app.db.search import setup_search_index
+    from app.models.event import Event
+    from app.models.user import User
+
+    run_migrations()
+    setup_search_index(engine)
+    with Session(engine) as session:
+        if session.exec(select(User.id).where(User.email == "bench0@example.com")).first() is None:
+            summary = generate(
+                session, users, events, rsvps, comments, seed=seed, password=PASSWORD, email_prefix="bench",
+                anchor=anchor
+            )
+            print(f"Seeded {summary}", file=sys.stderr)
+
+        user_ids = list(session.exec(select(User.id).where(User.email.like("bench%@example.com")).order_by(User.id)).all())
+        # Generated events are numbered by popularity, so the first ids are the hot ones
+        event_ids = list(session.exec(select(Event.id).where(Event.is_active == True).order_by(Event.id)).all())
+
+    # Tokens are signed locally so authenticated scenarios do not pay for password hashing
+    tokens = [create_access_token({"sub": str(user_id)}) for user_id in user_ids[:token_count]]
+    return Context(user_ids, event_ids, tokens)
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(port: int, workers: int, env: dict) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+    ]
+    return subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+
+def wait_until_ready(base_url: str, server: Optional[subprocess.Popen], timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server is not None and server.poll() is not None:
+            raise SystemExit(f"Server exited with code {server.returncode}")
+        try:
+            if httpx.get(base_url + "/", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit(f"Server at {base_url} did not become ready in {timeout:.0f}s")
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+async def drive(client: httpx.AsyncClient, name: str, ctx: Context, concurrency: int,
+                duration: float, max_requests: Optional[int], seed: int) -> dict:
+    """Run one scenario with concurrency closed-loop workers; each sends its next request on a response."""
+    pick = SCENARIOS[name]
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    sent = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(index: int) -> None:
+        nonlocal sent
+        rng = random.Random(f"{seed}:{name}:{index}")
+        while time.perf_counter() < deadline and (max_requests is None or sent < max_requests):
+            sent += 1
+            method, url, options = pick(ctx, rng)
+            started_at = time.perf_counter()
+            try:
+                response = await client.request(method, url, **options)
+                statuses[str(response.status_code)] += 1
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    errors = sum(count for code, count in statuses.items() if not code.isdigit() or code.startswith("5"))
+    return {
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "statuses": dict(sorted(statuses.items())),
+        "duration_s": round(elapsed, 3),
+        "rps": round(len(latencies_ms) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies_ms) / len(latencies_ms), 2) if latencies_ms else 0.0,
+            "p50": round(percentile(latencies_ms, 0.50), 2),
+            "p95": round(percentile(latencies_ms, 0.95), 2),
+            "p99": round(percentile(latencies_ms, 0.99), 2),
+            "max": round(latencies_ms[-1], 2) if latencies_ms else 0.0,
+        },
+    }
+
+async def run_scenarios(base_url: str, ctx: Context, args) -> Dict[str, dict]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    results = {}
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        for name in args.scenarios:
+            if args.warmup > 0:
+                await drive(client, name, ctx, args.concurrency, args.warmup, None, args.seed + 1)
+            results[name] = await drive(client, name, ctx, args.concurrency, args.duration, args.requests, args.seed)
+            summary = results[name]
+            print(
+                f"{name:>8}: {summary['rps']:>8} req/s  p50 {summary['latency_ms']['p50']} ms  "
+                f"p95 {summary['latency_ms']['p95']} ms  p99 {summary['latency_ms']['p99']} ms  "
+                f"errors {summary['errors']}",
+                file=sys.stderr
+            )
+    return results
+
+def dataset_mismatches(meta: dict, baseline_meta: dict) -> List[str]:
+    """Dataset settings that differ from the baseline's, which would make a comparison meaningless."""
+    return [
+        f"{field} {baseline_meta.get(field)!r} != {meta.get(field)!r}"
+        for field in DATASET_FIELDS if baseline_meta.get(field) != meta.get(field)
+    ]
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], max_regression: float) -> List[str]:
+    """Scenarios whose p95 latency rose or throughput fell by more than max_regression."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        p95, previous_p95 = current["latency_ms"]["p95"], previous["latency_ms"]["p95"]
+        if previous_p95 and p95 > previous_p95 * (1 + max_regression):
+            regressions.append(f"{name}: p95 {previous_p95} ms -> {p95} ms")
+        if previous["rps"] and current["rps"] < previous["rps"] * (1 - max_regression):
+            regressions.append(f"{name}: {previous['rps']} req/s -> {current['rps']} req/s")
+    return regressions
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the API over HTTP against a seeded database")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients per scenario")
+    parser.add_argument("--duration", type=float, default=10, help="seconds per scenario")
+    parser.add_argument("--requests", type=int, help="stop a scenario after this many requests")
+    parser.add_argument("--warmup", type=float, default=2, help="unmeasured seconds before each scenario")
+    parser.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--rsvps", type=int, default=20000)
+    parser.add_argument("--comments", type=int, default=4000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--anchor", type=datetime.fromisoformat,
+        help="date the generated data treats as 'now' (default: app.db.generate.DEFAULT_ANCHOR)"
+    )
+    parser.add_argument("--database-url", help="database to seed and serve (default: a fresh SQLite file)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="extra server setting")
+    parser.add_argument("--url", help="benchmark a running server (using --database-url and its SECRET_KEY)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="earlier JSON report; exit 1 on regressions")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed p95/throughput change")
+    args = parser.parse_args(argv)
+
+    temp_dir = None
+    database_url = args.database_url
+    if database_url is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix="eventify-bench-")
+        database_url = f"sqlite:///{Path(temp_dir.name) / 'bench.db'}"
+
+    # Settings are read from the environment on import, so set them before touching app modules
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "JOB_WORKER_ENABLED": "False",
+        **dict(item.split("=", 1) for item in args.env),
+    }
+    os.environ.update(env)
+    from app.db.generate import DEFAULT_ANCHOR
+    anchor = args.anchor or DEFAULT_ANCHOR
+
+    dataset = {
+        "seed": args.seed, "anchor": anchor.isoformat(), "users": args.users,
+        "events": args.events, "rsvps": args.rsvps, "comments": args.comments,
+    }
+    baseline = None
+    if args.baseline:
+        # Checked before running, since a different dataset makes the comparison meaningless
+        baseline = json.loads(Path(args.baseline).read_text())
+        mismatches = dataset_mismatches(dataset, baseline.get("meta", {}))
+        if mismatches:
+            raise SystemExit(f"Baseline was generated with a different dataset: {'; '.join(mismatches)}")
+
+    ctx = seed_database(
+        args.users, args.events, args.rsvps, args.comments, args.seed, anchor,
+        token_count=max(args.concurrency * 4, 1)
+    )
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(port, args.workers, env)
+    try:
+        wait_until_ready(base_url, server)
+        results = asyncio.run(run_scenarios(base_url, ctx, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": database_url.split(":", 1)[0],
+            "workers": args.workers if server is not None else None,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            **dataset,
+            "active_events": len(ctx.event_ids),
+            "env": args.env,
+        },
+        "scenarios": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if baseline is not None:
+        regressions = compare(results, baseline["scenarios"], args.max_regression)
+        for line in regressions:
+            print(f"Regression: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+from itertools import count
+
+# Settings are read on import, so point the app at a throwaway database first
+_database_dir = tempfile.mkdtemp(prefix="eventify-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_database_dir}/test.db"
+os.environ["RESPONSE_CACHE_BACKEND"] = "memory"
+os.environ["LIVE_BACKEND"] = "memory"
+os.environ["JOB_WORKER_ENABLED"] = "False"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from app.core.auth import create_access_token, get_password_hash
+from app.db.database import engine, run_migrations
+from app.main import app
+from app.models.user import User, UserRole
+
+_unique = count(1)
+
+@pytest.fixture(scope="session")
+def client():
+    run_migrations()
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture(scope="session")
+def hashed_password() -> str:
+    return get_password_hash("password123")
+
+@pytest.fixture
+def session():
+    with Session(engine) as db_session:
+        yield db_session
+
+@pytest.fixture
+def make_user(session, hashed_password):
+    """Create a user and return (user, auth headers)."""
+    def make(role: UserRole = UserRole.ATTENDEE):
+        user = User(
+            email=f"user{next(_unique)}@example.com", full_name="Test User",
+            role=role, hashed_password=hashed_password
+        )
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        return user, {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+    return make
+
+@pytest.fixture
+def make_event(client, make_user):
+    """Create an event through the API and return its JSON; organizer_headers picks the owner."""
+    def make(organizer_headers=None, **fields):
+        if organizer_headers is None:
+            _, organizer_headers = make_user(UserRole.ORGANIZER)
+        data = {
+            "title": "Test Event",
+            "description": "An event created by the tests",
+            "category": "tech",
+            "date": (datetime.utcnow() + timedelta(days=7)).isoformat(),
+            "location": "Hall 1",
+            "max_attendees": 10,
+            **fields,
+        }
+        response = client.post("/api/v1/events/", json=data, headers=organizer_headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+    return make
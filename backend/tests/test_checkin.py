@@ -0,0 +1,50 @@
+import pytest
+from app.core.checkin import create_checkin_code, verify_checkin_code
+from app.models.user import UserRole
+
+def test_genuine_code_verifies():
+    assert verify_checkin_code(create_checkin_code(7, 3)) == (3, 7)
+    assert verify_checkin_code(f"  {create_checkin_code(7, 3)}\n") == (3, 7)
+
+@pytest.mark.parametrize("code", [
+    "", "garbage", "1.2", "1.2.3.4", "a.b.c", "1.2.é", "é.2.abc", "1.2.AAAAAAAAAAAAAAAA", None,
+])
+def test_malformed_code_is_rejected(code):
+    assert verify_checkin_code(code) is None
+
+def test_tampered_code_is_rejected():
+    event_id, rsvp_id, signature = create_checkin_code(7, 3).split(".")
+    assert verify_checkin_code(f"{event_id}.8.{signature}") is None
+    assert verify_checkin_code(f"{event_id}.{rsvp_id}.{signature[:-1]}é") is None
+
+def test_batch_reports_bad_codes_as_invalid(client, make_user, make_event):
+    _, organizer = make_user(UserRole.ORGANIZER)
+    event = make_event(organizer)
+    _, attendee = make_user()
+    client.post(f"/api/v1/events/{event['id']}/rsvp", json={"status": "going"}, headers=attendee)
+    code = client.get(f"/api/v1/events/{event['id']}/checkin-code", headers=attendee).json()["code"]
+
+    response = client.post(
+        f"/api/v1/events/{event['id']}/checkin",
+        json={"scans": [{"code": "1.2.é"}, {"code": code}, {"code": "not a code"}]},
+        headers=organizer
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [result["result"] for result in body["results"]] == ["invalid", "checked_in", "invalid"]
+    assert body["checked_in_count"] == 1
+
+def test_checkin_refreshes_cached_event_lists(client, make_user, make_event):
+    organizer_user, organizer = make_user(UserRole.ORGANIZER)
+    event = make_event(organizer)
+    _, attendee = make_user()
+    client.post(f"/api/v1/events/{event['id']}/rsvp", json={"status": "going"}, headers=attendee)
+    code = client.get(f"/api/v1/events/{event['id']}/checkin-code", headers=attendee).json()["code"]
+
+    params = {"created_by": organizer_user.id}
+    assert client.get("/api/v1/events/", params=params).json()[0]["checked_in_count"] == 0
+    client.post(f"/api/v1/events/{event['id']}/checkin", json={"scans": [{"code": code}]}, headers=organizer)
+
+    listed = client.get("/api/v1/events/", params=params)
+    assert listed.headers["X-Cache"] == "MISS"
+    assert listed.json()[0]["checked_in_count"] == 1
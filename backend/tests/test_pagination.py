@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+import pytest
+from fastapi import HTTPException
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.models.user import UserRole
+
+def test_cursor_round_trip():
+    values = [datetime(2026, 5, 1, 18, 30), 42]
+    assert decode_cursor(encode_cursor(values), (datetime, int)) == values
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1]), encode_cursor(["x", "y"])])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor(cursor, (datetime, int))
+    assert excinfo.value.status_code == 400
+
+def test_event_pages_follow_cursor(client, make_user, make_event):
+    organizer, headers = make_user(UserRole.ORGANIZER)
+    base = datetime.utcnow().replace(microsecond=0) + timedelta(days=30)
+    # Shared dates make the id tie-breaker matter
+    dates = [base, base, base + timedelta(days=1), base - timedelta(days=1), base, base + timedelta(days=2), base]
+    created = [make_event(headers, date=date.isoformat()) for date in dates]
+    expected = [event["id"] for event in sorted(created, key=lambda e: (e["date"], e["id"]))]
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"created_by": organizer.id, "limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/events/", params=params)
+        assert response.status_code == 200
+        seen += [event["id"] for event in response.json()]
+        pages += 1
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert pages == 3
+
+def test_event_list_rejects_invalid_cursor(client):
+    response = client.get("/api/v1/events/", params={"cursor": "garbage"})
+    assert response.status_code == 400
@@ -0,0 +1,60 @@
+from app.db.counters import reconcile_event_counters
+from app.models.user import UserRole
+
+def rsvp(client, event_id, headers, status):
+    return client.post(f"/api/v1/events/{event_id}/rsvp", json={"status": status}, headers=headers)
+
+def counts(client, event_id):
+    event = client.get(f"/api/v1/events/{event_id}").json()
+    return event["going_count"], event["interested_count"]
+
+def test_rsvp_upsert_moves_counters(client, make_user, make_event):
+    event = make_event()
+    _, headers = make_user()
+
+    first = rsvp(client, event["id"], headers, "going")
+    assert first.status_code == 200
+    assert first.json()["status"] == "going"
+    assert counts(client, event["id"]) == (1, 0)
+
+    # Repeating a status updates the same row and counts once
+    again = rsvp(client, event["id"], headers, "going")
+    assert again.json()["id"] == first.json()["id"]
+    assert counts(client, event["id"]) == (1, 0)
+
+    assert rsvp(client, event["id"], headers, "interested").status_code == 200
+    assert counts(client, event["id"]) == (0, 1)
+
+    assert rsvp(client, event["id"], headers, "not_going").status_code == 200
+    assert counts(client, event["id"]) == (0, 0)
+
+def test_full_event_rejects_going(client, session, make_user, make_event):
+    event = make_event(max_attendees=1)
+    _, first = make_user()
+    _, second = make_user()
+
+    assert rsvp(client, event["id"], first, "going").status_code == 200
+    full = rsvp(client, event["id"], second, "going")
+    assert full.status_code == 409
+    assert counts(client, event["id"]) == (1, 0)
+
+    # Other statuses are not limited, and a freed seat can be taken
+    assert rsvp(client, event["id"], second, "interested").status_code == 200
+    assert rsvp(client, event["id"], first, "not_going").status_code == 200
+    assert rsvp(client, event["id"], second, "going").status_code == 200
+    assert counts(client, event["id"]) == (1, 0)
+
+    # The incrementally maintained counters match a full recount
+    assert reconcile_event_counters(session) == 0
+
+def test_rsvp_to_deleted_event_is_not_found(client, make_user, make_event):
+    _, organizer = make_user(UserRole.ORGANIZER)
+    event = make_event(organizer)
+    _, headers = make_user()
+
+    assert client.delete(f"/api/v1/events/{event['id']}", headers=organizer).status_code == 200
+    assert rsvp(client, event["id"], headers, "going").status_code == 404
+
+def test_rsvp_to_missing_event_is_not_found(client, make_user):
+    _, headers = make_user()
+    assert rsvp(client, 999999, headers, "going").status_code == 404
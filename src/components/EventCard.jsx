@@ -69,7 +69,7 @@ export default function EventCard({ event, onRSVP, userRSVP }) {
           
           <div className="flex items-center text-sm text-gray-500">
             <UsersIcon className="h-4 w-4 mr-2" />
-            {event.attendees_count} / {event.max_attendees} attendees
+            {event.going_count ?? 0} / {event.max_attendees} attendees
           </div>
         </div>
 
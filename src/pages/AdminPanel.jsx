@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react'
-import { eventsAPI, adminAPI } from '../services/api'
+import { eventsAPI, adminAPI, liveAPI } from '../services/api'
 import { useAuth } from '../contexts/AuthContext'
 import { useProfile } from '../contexts/ProfileContext'
 import AvatarSelector from '../components/AvatarSelector'
@@ -29,6 +29,25 @@ export default function AdminPanel() {
     }
   }, [user])
 
+  // Keep the going/maybe tallies current while the dashboard is open
+  useEffect(() => {
+    const live = liveAPI.subscribeEvents(events.map(event => event.id), (message) => {
+      if (message.type === 'resync') {
+        loadAdminData()
+      } else if (message.type === 'rsvp_counts') {
+        setRsvpData(prev => prev[message.event_id] ? {
+          ...prev,
+          [message.event_id]: {
+            ...prev[message.event_id],
+            going: message.going_count,
+            maybe: message.interested_count
+          }
+        } : prev)
+      }
+    })
+    return () => live.close()
+  }, [events])
+
   const loadAdminData = async () => {
     try {
       setLoading(true)
@@ -39,14 +58,12 @@ export default function AdminPanel() {
       const processedRsvpData = {}
       eventsWithRSVPs.forEach(event => {
         const rsvps = event.rsvps || []
-        const going = rsvps.filter(rsvp => rsvp.status === 'going')
-        const maybe = rsvps.filter(rsvp => rsvp.status === 'maybe')
-        const notGoing = rsvps.filter(rsvp => rsvp.status === 'not_going')
-        
+        const counts = event.rsvp_counts || {}
+
         processedRsvpData[event.id] = {
-          going: going.length,
-          maybe: maybe.length,
-          not_going: notGoing.length,
+          going: counts.going || 0,
+          maybe: counts.interested || 0,
+          not_going: counts.not_going || 0,
           attendees: rsvps.map(rsvp => ({
             id: rsvp.user_id,
             name: rsvp.user?.full_name || rsvp.user?.email || 'Unknown User',
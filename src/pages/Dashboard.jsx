@@ -90,7 +90,7 @@ export default function Dashboard() {
     // Only show "Total Attendees" for organizers and admins
     ...(user?.role !== 'attendee' ? [{
       name: 'Total Attendees',
-      value: myEvents.reduce((sum, event) => sum + (event.attendees_count || 0), 0),
+      value: myEvents.reduce((sum, event) => sum + (event.going_count || 0), 0),
       icon: QrCodeIcon,
       color: 'bg-purple-500'
     }] : [])
@@ -321,7 +321,7 @@ export default function Dashboard() {
                         </div>
                         <div className="flex items-center mt-1 text-sm text-gray-500">
                           <UsersIcon className="h-4 w-4 mr-1" />
-                          {event.attendees_count} / {event.max_attendees} attendees
+                          {event.going_count ?? 0} / {event.max_attendees} attendees
                         </div>
                       </div>
                       {/* Only show edit/delete for organizers and admins */}
@@ -1,5 +1,5 @@
-import { useState, useEffect } from 'react'
-import { eventsAPI } from '../services/api'
+import { useState, useEffect, useRef } from 'react'
+import { eventsAPI, liveAPI } from '../services/api'
 import EventCard from '../components/EventCard'
 import { useAuth } from '../contexts/AuthContext'
 import { MagnifyingGlassIcon, FunnelIcon } from '@heroicons/react/24/outline'
@@ -16,10 +16,29 @@ export default function Events() {
     location: ''
   })
 
+  const liveRef = useRef(null)
+
   useEffect(() => {
     loadEvents()
   }, [filters])
 
+  // Follow attendee counts for the events on screen instead of refetching the list
+  useEffect(() => {
+    const live = liveAPI.subscribeEvents(events.map(event => event.id), (message) => {
+      if (message.type === 'resync') {
+        loadEvents()
+      } else if (message.type === 'rsvp_counts') {
+        setEvents(prev => prev.map(event =>
+          event.id === message.event_id
+            ? { ...event, going_count: message.going_count, interested_count: message.interested_count }
+            : event
+        ))
+      }
+    })
+    liveRef.current = live
+    return () => live.close()
+  }, [events.map(event => event.id).join(',')])
+
   useEffect(() => {
     // Reload events when user logs in/out to get fresh RSVP data
     if (user) {
@@ -32,7 +51,7 @@ export default function Events() {
   const loadEvents = async () => {
     try {
       setLoading(true)
-      const data = await eventsAPI.getAll({ ...filters, search: searchTerm })
+      const data = await eventsAPI.getAll({ ...filters, search: searchTerm, view: 'card' })
       setEvents(data)
 
       // Load user RSVPs if logged in
@@ -50,21 +69,10 @@ export default function Events() {
     if (!user) return
     
     try {
-      const rsvpMap = {}
-      // Get user's RSVP status for each event
-      await Promise.all(
-        eventsList.map(async (event) => {
-          try {
-            const rsvps = await eventsAPI.getRSVPs(event.id)
-            const userRSVP = rsvps.find(rsvp => rsvp.user_id === user.id)
-            if (userRSVP) {
-              rsvpMap[event.id] = userRSVP
-            }
-          } catch (error) {
-            // If no RSVP found, continue
-            console.log(`No RSVP found for event ${event.id}`)
-          }
-        })
+      // Get user's RSVP status for every event on the page
+      const rsvpMap = await eventsAPI.getMyRSVPs(
+        eventsList.map(event => event.id),
+        user.id
       )
       setUserRSVPs(rsvpMap)
     } catch (error) {
@@ -90,8 +98,10 @@ export default function Events() {
         return updated
       })
 
-      // Refresh events to update attendee count
-      loadEvents()
+      // The live stream delivers the new attendee count; refetch only without it
+      if (!liveRef.current?.isOpen()) {
+        loadEvents()
+      }
     } catch (error) {
       console.error('RSVP failed:', error)
       // Remove the optimistic update on error
@@ -2,6 +2,9 @@ import axios from 'axios'
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000/api/v1'
 
+// Fetch the user's RSVPs for a whole page in one request (set to 'false' to use per-event calls)
+const USE_BATCH_RSVPS = import.meta.env.VITE_BATCH_RSVPS !== 'false'
+
 const api = axios.create({
   baseURL: API_BASE_URL,
   headers: {
@@ -97,6 +100,35 @@ export const eventsAPI = {
   getRSVPs: async (eventId) => {
     const { data } = await api.get(`/events/${eventId}/rsvps`)
     return data
+  },
+  // Current user's RSVPs for a list of events, keyed by event id
+  getMyRSVPs: async (eventIds, userId) => {
+    if (!eventIds.length) return {}
+
+    if (USE_BATCH_RSVPS) {
+      const { data } = await api.get('/events/rsvps/me', {
+        params: { event_ids: eventIds },
+        paramsSerializer: { indexes: null },  // event_ids=1&event_ids=2
+      })
+      return Object.fromEntries(data.map(rsvp => [rsvp.event_id, rsvp]))
+    }
+
+    // Legacy fallback: one request per event
+    const rsvpMap = {}
+    await Promise.all(
+      eventIds.map(async (eventId) => {
+        try {
+          const rsvps = await eventsAPI.getRSVPs(eventId)
+          const userRSVP = rsvps.find(rsvp => rsvp.user_id === userId)
+          if (userRSVP) {
+            rsvpMap[eventId] = userRSVP
+          }
+        } catch (error) {
+          console.log(`No RSVP found for event ${eventId}`)
+        }
+      })
+    )
+    return rsvpMap
   }
 }
 
@@ -106,27 +138,49 @@ export const adminAPI = {
     const { data } = await api.get(`/events/${eventId}/rsvps`)
     return data
   },
+  getRSVPReport: async ({ skip = 0, limit = 100, includeAttendees = false } = {}) => {
+    const { data } = await api.get('/events/rsvps/report', {
+      params: { skip, limit, include_attendees: includeAttendees }
+    })
+    return data
+  },
   getAllEventsWithRSVPs: async () => {
-    const events = await eventsAPI.getAll()
-    const eventsWithRSVPs = await Promise.all(
-      events.map(async (event) => {
-        try {
-          const rsvps = await api.get(`/events/${event.id}/rsvps`)
-          return {
-            ...event,
-            rsvps: rsvps.data
-          }
-        } catch (error) {
-          // If user doesn't have access to this event's RSVPs, return event without RSVPs
-          return {
-            ...event,
-            rsvps: []
-          }
-        }
-      })
-    )
+    // Page through the server-side report instead of one request per event
+    const limit = 100
+    const eventsWithRSVPs = []
+    let skip = 0
+    let hasMore = true
+    while (hasMore) {
+      const page = await adminAPI.getRSVPReport({ skip, limit, includeAttendees: true })
+      eventsWithRSVPs.push(...page.events)
+      hasMore = page.has_more
+      skip += limit
+    }
     return eventsWithRSVPs
   }
 }
 
+// Live updates (Server-Sent Events)
+export const liveAPI = {
+  // Follow RSVP counts, comments and check-ins for up to 100 events.
+  // Returns { close, isOpen }; onMessage receives { type, event_id, ... }, and
+  // type 'resync' means updates were dropped and the caller should refetch.
+  subscribeEvents: (eventIds, onMessage) => {
+    if (!eventIds.length || typeof EventSource === 'undefined') {
+      return { close: () => {}, isOpen: () => false }
+    }
+    const params = new URLSearchParams()
+    eventIds.slice(0, 100).forEach(id => params.append('ids', id))
+    const source = new EventSource(`${API_BASE_URL}/live/events?${params}`)
+    const handler = (e) => onMessage(JSON.parse(e.data))
+    ;['rsvp_counts', 'comment', 'comments_approved', 'checkin', 'resync'].forEach(type =>
+      source.addEventListener(type, handler)
+    )
+    return {
+      close: () => source.close(),
+      isOpen: () => source.readyState === EventSource.OPEN
+    }
+  }
+}
+
 export default api
\ No newline at end of file